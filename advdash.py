@@ -1,36 +1,41 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
-import re
+from wordcloud import WordCloud, STOPWORDS
+import io
+import os
+import perf
+import resources
+from dash_data import DATA_PATH
+from dash_cube import FilterCube
+from dash_charts import histogram_figure, box_figure, payload_bytes, MAX_POINTS_PER_TRACE
 
 # --- Load and Preprocess Dataset ---
-df = pd.read_csv("C:\\Users\\sayed\\OneDrive\\Desktop\\Major PRO\\naukri_data_science_jobs_india.csv")
-
-# Rename columns to match expected names
-df.rename(columns={
-    'Job Title': 'Job_Role',
-    'Company': 'Company',
-    'Location': 'Location',
-    'Job Experience': 'Job Experience',
-    'Skills/Description': 'Skills/Description'
-}, inplace=True)
-
-# Extract or simulate posted date
-df['Posted Date'] = pd.to_datetime(df['Job Experience'].apply(
-    lambda x: datetime.now() - timedelta(days=int(re.search(r'\d+', str(x)).group())*7
-    if pd.notnull(x) and re.search(r'\d+', str(x)) else 14)))
-
-# Clean columns
-df['Location'] = df['Location'].astype(str).str.split(',').str[0].str.strip()
-df['Job_Role'] = df['Job_Role'].astype(str).str.strip().str.title()
-df['Experience Min'] = df['Job Experience'].str.extract(r'(\d+)').astype(float)
-df.dropna(subset=['Location'], inplace=True)
+# One parsed copy per process, shared by every session; reloaded when the file changes
+data_version = os.path.getmtime(DATA_PATH)
+df = resources.get("dash_table", DATA_PATH, data_version)
+
+# --- Pre-aggregated filter cube (rebuilt only when the data file changes) ---
+# Only the current version is kept: a new data file evicts the previous cube.
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_filter_cube(_df, data_version):
+    return FilterCube(_df, _df.attrs['loaded_at'], text_column='Skills/Description', stopwords=STOPWORDS)
+
+# --- Rendered word clouds, one per filter state (bounded, least recently used dropped) ---
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_wordcloud_png(_cube, role, locations, max_days, data_version):
+    frequencies = _cube.slice(role, list(locations), max_days).term_frequencies()
+    if not frequencies:
+        return None
+    wc = WordCloud(width=1000, height=400, background_color="#0f1c2e", colormap="plasma")
+    buffer = io.BytesIO()
+    wc.generate_from_frequencies(frequencies).to_image().save(buffer, format="PNG")
+    return buffer.getvalue()
 
 # --- Streamlit App Setup ---
 st.set_page_config(page_title="📊 DS Job Dashboard", layout="wide", initial_sidebar_state="expanded")
+perf.configure("advdash")
+profiler = perf.start_profiler("advdash", perf.profiling_requested(st.query_params))
 
 # --- Custom Dark Style ---
 st.markdown("""
@@ -78,80 +83,86 @@ with st.sidebar:
     time_filter = st.selectbox("Job Posted", options=["All Time", "1 week ago", "2 weeks ago", "1 month ago"])
 
 # --- Apply Filters ---
-filtered_df = df.copy()
-
-if role_filter != "All":
-    filtered_df = filtered_df[filtered_df['Job_Role'] == role_filter]
-
-if location_filter:
-    filtered_df = filtered_df[filtered_df['Location'].isin(location_filter)]
-
-if time_filter != "All Time":
-    days_map = {
-        "1 week ago": 7,
-        "2 weeks ago": 14,
-        "1 month ago": 30
-    }
-    cutoff = datetime.now() - timedelta(days=days_map[time_filter])
-    filtered_df = filtered_df[filtered_df['Posted Date'] >= cutoff]
+days_map = {
+    "1 week ago": 7,
+    "2 weeks ago": 14,
+    "1 month ago": 30
+}
+cube = get_filter_cube(df, data_version)
+cube_slice = cube.slice(role_filter, location_filter, days_map.get(time_filter))
 
 # --- Metrics ---
 col1, col2, col3, col4 = st.columns(4)
 with col1:
-    st.metric("📌 Total Jobs", len(filtered_df))
+    st.metric("📌 Total Jobs", cube_slice.total_jobs())
 with col2:
-    st.metric("🏙️ Locations", filtered_df['Location'].nunique())
+    st.metric("🏙️ Locations", cube_slice.location_count())
 with col3:
-    st.metric("🏢 Companies", filtered_df['Company'].nunique())
+    st.metric("🏢 Companies", cube_slice.company_count())
 with col4:
-    avg_exp = filtered_df['Experience Min'].mean()
+    avg_exp = cube_slice.avg_experience()
     st.metric("💼 Avg Exp (yrs)", f"{avg_exp:.1f}" if not pd.isna(avg_exp) else "N/A")
 
 # --- Charts ---
+# Every figure is built from pre-aggregated data. Measuring its JSON size
+# serializes it a second time, so the size is only shown on profiled reruns.
+show_payload = profiler is not None
+
+def show_chart(fig, name):
+    with perf.stage("chart_render", chart=name):
+        st.plotly_chart(fig, use_container_width=True)
+    if show_payload:
+        st.caption(f"Chart payload: {payload_bytes(fig) / 1024:.1f} KB")
+
+experience_counts = cube_slice.experience_counts()
+
 st.markdown("### 📍 Top Locations by Job Count")
-top_locations = filtered_df['Location'].value_counts().head(10).reset_index()
-top_locations.columns = ['Location', 'Count']
-fig1 = px.bar(top_locations, x='Location', y='Count', color='Count',
-              color_continuous_scale='deep', template='plotly_dark')
-st.plotly_chart(fig1, use_container_width=True)
+with perf.stage("chart_build", chart="top_locations"):
+    top_locations = cube_slice.top('Location')
+    fig1 = px.bar(top_locations, x='Location', y='Count', color='Count',
+                  color_continuous_scale='deep', template='plotly_dark')
+show_chart(fig1, "top_locations")
 
 st.markdown("### 📊 Experience Distribution")
-exp_data = filtered_df.dropna(subset=['Experience Min'])
-fig2 = px.histogram(exp_data, x='Experience Min', nbins=10, template='plotly_dark',
-                    color_discrete_sequence=['#FFA07A'])
-st.plotly_chart(fig2, use_container_width=True)
+with perf.stage("chart_build", chart="experience_histogram"):
+    exp_data = experience_counts.groupby('Experience Min')['count'].sum().reset_index()
+    fig2 = histogram_figure(exp_data, 'Experience Min', nbins=10, template='plotly_dark',
+                            color_discrete_sequence=['#FFA07A'])
+show_chart(fig2, "experience_histogram")
 
 # --- Word Cloud for Skills ---
 st.markdown("### ☁️ Top Skills Word Cloud")
-skill_text = " ".join(filtered_df["Skills/Description"].dropna().astype(str).values).lower()
-wc = WordCloud(width=1000, height=400, background_color="#0f1c2e", colormap="plasma").generate(skill_text)
-
-fig, ax = plt.subplots(figsize=(12, 4))
-plt.imshow(wc, interpolation="bilinear")
-plt.axis("off")
-st.pyplot(fig)
+with perf.stage("chart_build", chart="skills_wordcloud"):
+    wordcloud_png = get_wordcloud_png(cube, role_filter, tuple(sorted(location_filter)),
+                                      days_map.get(time_filter), data_version)
+if wordcloud_png is None:
+    st.info("No skills to show for these filters.")
+else:
+    st.image(wordcloud_png, use_container_width=True)
 
 # --- Top Companies by Job Count ---
 st.markdown("### 🏢 Top Hiring Companies")
-top_companies = filtered_df['Company'].value_counts().head(10).reset_index()
-top_companies.columns = ['Company', 'Count']
-fig3 = px.bar(top_companies, x='Company', y='Count', color='Count',
-              color_continuous_scale='teal', template='plotly_dark')
-st.plotly_chart(fig3, use_container_width=True)
+with perf.stage("chart_build", chart="top_companies"):
+    top_companies = cube_slice.top('Company')
+    fig3 = px.bar(top_companies, x='Company', y='Count', color='Count',
+                  color_continuous_scale='teal', template='plotly_dark')
+show_chart(fig3, "top_companies")
 
 # --- Top Job Roles ---
 st.markdown("### 👔 Most Common Job Roles")
-top_roles = filtered_df['Job_Role'].value_counts().head(10).reset_index()
-top_roles.columns = ['Job Role', 'Count']
-fig4 = px.bar(top_roles, x='Job Role', y='Count', color='Count',
-              color_continuous_scale='magma', template='plotly_dark')
-st.plotly_chart(fig4, use_container_width=True)
+with perf.stage("chart_build", chart="top_roles"):
+    top_roles = cube_slice.top('Job_Role').rename(columns={'Job_Role': 'Job Role'})
+    fig4 = px.bar(top_roles, x='Job Role', y='Count', color='Count',
+                  color_continuous_scale='magma', template='plotly_dark')
+show_chart(fig4, "top_roles")
 
 # --- Experience vs Job Role (Box Plot) ---
 st.markdown("### 📈 Experience Distribution by Job Role")
-box_data = filtered_df[['Job_Role', 'Experience Min']].dropna()
-top_5_roles = box_data['Job_Role'].value_counts().nlargest(5).index
-box_data = box_data[box_data['Job_Role'].isin(top_5_roles)]
-fig5 = px.box(box_data, x='Job_Role', y='Experience Min', color='Job_Role',
-              template='plotly_dark', points='all')
-st.plotly_chart(fig5, use_container_width=True)
+with perf.stage("chart_build", chart="experience_by_role"):
+    fig5 = box_figure(experience_counts, 'Job_Role', 'Experience Min', top_n=5,
+                      max_points=MAX_POINTS_PER_TRACE, template='plotly_dark')
+show_chart(fig5, "experience_by_role")
+
+# Opt-in sampling profile of this rerun (?profile=1)
+if profiler:
+    st.caption(f"Profile written to {profiler.stop()}")
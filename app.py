@@ -0,0 +1,22 @@
+import streamlit as st
+import resources
+
+# Single entry point for all tools: `streamlit run app.py`.
+# A page's script (and the heavy libraries it imports) only runs once someone
+# opens that page; shared data and clients come from the resources registry.
+
+# Optional warm-up, once per server process (ASCENDX_WARMUP=job_corpus,tfidf_index,...)
+@st.cache_resource
+def start_warm_up():
+    resources.warm_up()
+    return True
+
+start_warm_up()
+
+pages = [
+    st.Page("job_sugg.py", title="Job Recommender", icon="🔎", default=True),
+    st.Page("advdash.py", title="Job Dashboard", icon="📊"),
+    st.Page("chatbot.py", title="Career Assistant", icon="🧭"),
+    st.Page("quro.py", title="Quiz & Roadmap", icon="🧩"),
+]
+st.navigation(pages).run()
@@ -0,0 +1,283 @@
+import os
+import sys
+import json
+import glob
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+import numpy as np
+import perf
+import synth_data
+
+BASELINE_PATH = "bench_baseline.json"
+# A case regresses when its median time grows by more than this fraction
+REGRESSION_THRESHOLD = 0.2
+# Timings under this many seconds are too noisy to flag
+MIN_FLAGGED_SECONDS = 0.005
+N_QUERIES = 50
+
+
+def measure(fn, repeat=3):
+    # Median wall time over repeats; memory is the RSS growth of the first run
+    times, result, memory_delta = [], None, None
+    for i in range(repeat):
+        rss_before = perf.rss_bytes()
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+        if i == 0 and rss_before is not None:
+            memory_delta = perf.rss_bytes() - rss_before
+    return result, {
+        "median_s": statistics.median(times), "min_s": min(times),
+        "repeat": repeat, "rss_delta_bytes": memory_delta,
+    }
+
+
+# Each case takes the shared state dict, may add to it for later cases, and returns its stats
+def case_corpus_ingest(state):
+    import job_store
+    store = os.path.join(state["workdir"], "job_store")
+    paths = state["paths"]
+    count, stats = measure(lambda: job_store.build_store(paths["merged"], paths["skills"], store), 1)
+    state["store"] = store
+    return dict(stats, rows=count)
+
+
+def case_corpus_load(state):
+    import job_store
+    df, stats = measure(lambda: job_store.load_corpus(state["store"]))
+    state["corpus"] = df
+    return dict(stats, rows=len(df))
+
+
+def case_tfidf_build(state):
+    import tfidf_index
+    texts = state["corpus"]['combined_text'].tolist()
+    index, stats = measure(lambda: tfidf_index.TfidfIndex.build(texts), 1)
+    state["index"] = index
+    rng = np.random.default_rng(0)
+    rows = rng.choice(len(texts), size=min(N_QUERIES, len(texts)), replace=False)
+    state["queries"] = [index.transform([" ".join(texts[r].split()[:40])]) for r in rows]
+    return dict(stats, docs=index.n_docs, nnz=int(index.matrix.nnz))
+
+
+def case_resume_extract(state):
+    from resume_parser import extract_text
+    files = sorted(glob.glob(os.path.join(state["paths"]["resumes"], "*")))
+
+    def run():
+        texts = []
+        for path in files:
+            with open(path, "rb") as f:
+                texts.append(extract_text(f, path.lower()))
+        return texts
+    texts, stats = measure(run)
+    state["resume_texts"] = texts
+    return dict(stats, files=len(files))
+
+
+def case_resume_spacy_parse(state):
+    from resume_parser import extract_resume_info_batch
+    _, stats = measure(lambda: extract_resume_info_batch(state["resume_texts"]))
+    return dict(stats, resumes=len(state["resume_texts"]))
+
+
+def case_facet_build(state):
+    from job_facets import FacetIndex
+    facets, stats = measure(lambda: FacetIndex(state["corpus"]))
+    state["facets"] = facets
+    return stats
+
+
+def _per_query(engine_search, queries):
+    def run():
+        for q in queries:
+            engine_search(q)
+    _, stats = measure(run)
+    stats["per_query_ms"] = stats["median_s"] / max(1, len(queries)) * 1000
+    return stats
+
+
+def case_similarity_lexical(state):
+    from job_search import JobSearchEngine
+    engine = JobSearchEngine(state["index"].matrix, state["facets"].has_link)
+    state["engine"] = engine
+    return _per_query(lambda q: engine.search(q, k=100, threshold=0.2), state["queries"])
+
+
+def case_similarity_filtered(state):
+    mask = state["facets"].mask(cities=["bangalore"], experience="Fresher")
+    engine = state["engine"]
+    stats = _per_query(lambda q: engine.search(q, k=100, threshold=0.2, mask=mask), state["queries"])
+    return dict(stats, eligible=int(mask.sum()))
+
+
+def case_semantic_build(state):
+    from semantic_search import SemanticIndex
+    index, stats = measure(lambda: SemanticIndex(state["index"].matrix, state["facets"].has_link), 1)
+    state["semantic"] = index
+    return stats
+
+
+def case_similarity_semantic(state):
+    semantic = state["semantic"]
+    return _per_query(lambda q: semantic.search(q, k=100), state["queries"])
+
+
+def case_dash_load(state):
+    from dash_data import load_job_table
+    df, stats = measure(lambda: load_job_table(state["paths"]["naukri"]))
+    state["dash"] = df
+    return dict(stats, rows=len(df))
+
+
+def case_dash_cube_build(state):
+    from dash_cube import FilterCube
+    df = state["dash"]
+    cube, stats = measure(lambda: FilterCube(df, df.attrs['loaded_at'], text_column='Skills/Description'))
+    state["cube"] = cube
+    return stats
+
+
+def case_dash_aggregate(state):
+    # The metrics, top-N tables and experience counts for a few filter states
+    cube = state["cube"]
+    filters = [("All", [], None), ("Data Scientist", [], 30), ("All", ["Bangalore", "Pune"], 7)]
+
+    def run():
+        for role, locations, days in filters:
+            s = cube.slice(role, locations, days)
+            s.total_jobs(), s.location_count(), s.company_count(), s.avg_experience()
+            s.top('Location'), s.top('Company'), s.top('Job_Role'), s.experience_counts()
+            s.term_frequencies()
+    return measure(run)[1]
+
+
+def case_dash_charts(state):
+    from dash_charts import histogram_figure, box_figure
+    counts = state["cube"].slice("All", [], None).experience_counts()
+
+    def run():
+        exp_data = counts.groupby('Experience Min')['count'].sum().reset_index()
+        histogram_figure(exp_data, 'Experience Min', nbins=10).to_json()
+        box_figure(counts, 'Job_Role', 'Experience Min', top_n=5).to_json()
+    return measure(run)[1]
+
+
+CASES = [
+    ("corpus_ingest", case_corpus_ingest),
+    ("corpus_load", case_corpus_load),
+    ("tfidf_build", case_tfidf_build),
+    ("resume_extract", case_resume_extract),
+    ("resume_spacy_parse", case_resume_spacy_parse),
+    ("facet_build", case_facet_build),
+    ("similarity_lexical", case_similarity_lexical),
+    ("similarity_filtered", case_similarity_filtered),
+    ("semantic_build", case_semantic_build),
+    ("similarity_semantic", case_similarity_semantic),
+    ("dash_load", case_dash_load),
+    ("dash_cube_build", case_dash_cube_build),
+    ("dash_aggregate", case_dash_aggregate),
+    ("dash_charts", case_dash_charts),
+]
+
+
+def run_suite(rows, resumes, selected=None, workdir=None, seed=0):
+    workdir = workdir or tempfile.mkdtemp(prefix="ascendx-bench-")
+    state = {"workdir": workdir}
+    _, generate = measure(lambda: state.update(paths=synth_data.write_all(workdir, rows, resumes, seed)), 1)
+    results = {"synth_generate": generate}
+    for name, case in CASES:
+        if selected and name not in selected:
+            continue
+        try:
+            results[name] = case(state)
+        except Exception as e:  # e.g. a missing optional model; later cases may still run
+            results[name] = {"error": repr(e)}
+        print(f"{name:<22}{_describe(results[name])}", flush=True)
+    return workdir, results
+
+
+def _describe(stats):
+    if "error" in stats:
+        return f"failed: {stats['error']}"
+    memory = stats.get("rss_delta_bytes")
+    memory = f"{memory / 2**20:+8.1f} MiB" if memory is not None else ""
+    return f"{stats['median_s'] * 1000:>10.1f} ms  {memory}"
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    # Cases whose median time grew past the threshold versus the baseline run,
+    # and cases that ran in the baseline but failed now (after and change are None)
+    regressions = []
+    for name, stats in results.items():
+        before = baseline.get("results", {}).get(name, {})
+        if "median_s" not in before:
+            continue
+        if "error" in stats:
+            regressions.append((name, before["median_s"], None, None))
+            continue
+        if stats["median_s"] < MIN_FLAGGED_SECONDS:
+            continue
+        change = stats["median_s"] / before["median_s"] - 1 if before["median_s"] else 0.0
+        if change > threshold:
+            regressions.append((name, before["median_s"], stats["median_s"], change))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark data load, matching and dashboard aggregation on synthetic data"
+    )
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--cases", nargs="*", help="Run only these cases (dependencies must be included)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--out", default=None, help="Also write this run's results to a JSON file")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--keep", action="store_true", help="Keep the generated data directory")
+    args = parser.parse_args()
+
+    perf.PERF_LOG = ""  # the suite reports its own timings
+    workdir, results = run_suite(args.rows, args.resumes, args.cases)
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "rows": args.rows, "resumes": args.resumes,
+        "python": sys.version.split()[0], "platform": platform.platform(), "cpus": os.cpu_count(),
+        "results": results,
+    }
+    if args.keep:
+        print(f"Synthetic data kept in {workdir}")
+    else:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    status = 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("rows") != args.rows:
+            print(f"Baseline was recorded with {baseline.get('rows')} rows; timings are not comparable")
+        else:
+            regressions = compare(results, baseline, args.threshold)
+            for name, before, after, change in regressions:
+                if after is None:
+                    print(f"REGRESSION {name}: failed ({results[name]['error']}), was {before * 1000:.1f} ms")
+                else:
+                    print(f"REGRESSION {name}: {before * 1000:.1f} ms -> {after * 1000:.1f} ms ({change:+.0%})")
+            if not regressions:
+                print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+            status = 1 if regressions else 0
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    sys.exit(status)
@@ -0,0 +1,125 @@
+import os
+import json
+import argparse
+import numpy as np
+import scipy.sparse as sp
+import job_store
+import tfidf_index
+import resume_ingest
+
+CANDIDATE_DIR = os.environ.get("ASCENDX_CANDIDATE_INDEX", "candidate_index")
+
+
+# Reverse matching: every stored resume is one row of a sparse matrix built
+# with the same TF-IDF index version as the job corpus, so ranking any number
+# of jobs against the whole pool is a single sparse matrix product.
+class CandidateIndex:
+    def __init__(self, vectorizer):
+        self.vectorizer = vectorizer
+        self.resume_ids = []
+        self.matrix = sp.csr_matrix((0, vectorizer.n_features))
+
+    def __len__(self):
+        return len(self.resume_ids)
+
+    def add(self, resume_ids, texts):
+        rows = self.vectorizer.transform([text.lower() for text in texts])
+        self.matrix = sp.vstack([self.matrix, rows], format='csr')
+        self.resume_ids.extend(resume_ids)
+
+    def rank(self, job_texts, k=20, threshold=0.0):
+        # One (jobs x resumes) product for the whole batch of jobs
+        job_vectors = self.vectorizer.transform(list(job_texts))
+        scores = (job_vectors @ self.matrix.T).tocsr()
+
+        results = []
+        for i in range(scores.shape[0]):
+            start, end = scores.indptr[i], scores.indptr[i + 1]
+            cols, vals = scores.indices[start:end], scores.data[start:end]
+            keep = vals > threshold
+            cols, vals = cols[keep], vals[keep]
+            if k is not None and len(vals) > k:
+                top = np.argpartition(-vals, k - 1)[:k]
+                cols, vals = cols[top], vals[top]
+            order = np.argsort(-vals, kind='stable')
+            results.append([(self.resume_ids[c], float(v)) for c, v in zip(cols[order], vals[order])])
+        return results
+
+    def save(self, path=CANDIDATE_DIR):
+        os.makedirs(path, exist_ok=True)
+        sp.save_npz(os.path.join(path, "matrix.npz"), self.matrix)
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({"resume_ids": self.resume_ids, "index_version": self.vectorizer.version}, f)
+
+    @classmethod
+    def load(cls, vectorizer, path=CANDIDATE_DIR):
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        if meta["index_version"] != vectorizer.version:
+            raise ValueError("Candidate index was built against a different TF-IDF index version; rebuild it.")
+        index = cls(vectorizer)
+        index.matrix = sp.load_npz(os.path.join(path, "matrix.npz")).tocsr()
+        index.resume_ids = meta["resume_ids"]
+        return index
+
+
+def resume_documents(records):
+    return [" ".join([r["text"], r["skills"], r["education"]]) for r in records]
+
+
+def jobs_by_key(df, listing_keys):
+    # Row positions shift whenever the corpus is re-filtered to cluster
+    # representatives, so jobs are addressed by their stable listing_key
+    jobs = df.set_index('listing_key', drop=False)
+    missing = [key for key in listing_keys if key not in jobs.index]
+    if missing:
+        raise KeyError(f"Unknown listing keys: {', '.join(missing)}")
+    return jobs.loc[list(listing_keys)]
+
+
+def rank_candidates(jobs, index, k=20):
+    # jobs: rows from job_store.load_corpus; results are keyed by listing_key
+    return dict(zip(jobs['listing_key'], index.rank(jobs['combined_text'], k=k)))
+
+
+def _corpus_vectorizer():
+    df = job_store.load_corpus()
+    vectorizer = tfidf_index.load_latest()
+    if vectorizer is None or vectorizer.n_docs != len(df):
+        raise SystemExit("TF-IDF index is missing or out of date; run `python tfidf_index.py update` first.")
+    return df, vectorizer
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rank stored resumes against job postings")
+    parser.add_argument("--index", default=CANDIDATE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build_cmd = sub.add_parser("build", help="Parse a directory or zip of resumes into the candidate index")
+    build_cmd.add_argument("resume_dir")
+
+    rank_cmd = sub.add_parser("rank", help="Rank the candidate pool for one or more job rows")
+    rank_cmd.add_argument("listing_keys", nargs="+", help="listing_key values of the jobs")
+    rank_cmd.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    df, vectorizer = _corpus_vectorizer()
+
+    if args.command == "build":
+        records = [r for r in resume_ingest.ingest([args.resume_dir]) if "error" not in r]
+        index = CandidateIndex(vectorizer)
+        index.add([r["name"] for r in records], resume_documents(records))
+        index.save(args.index)
+        print(f"Indexed {len(index)} resumes in {args.index}")
+    else:
+        index = CandidateIndex.load(vectorizer, args.index)
+        try:
+            jobs = jobs_by_key(df, args.listing_keys)
+        except KeyError as e:
+            raise SystemExit(e.args[0])
+        ranked = rank_candidates(jobs, index, k=args.top)
+        for listing_key, matches in ranked.items():
+            job = jobs.loc[listing_key]
+            print(f"Job {listing_key}: {job['job_title'].title()} at {job['company_name']}")
+            for resume_id, score in matches:
+                print(f"  {score:.3f}  {resume_id}")
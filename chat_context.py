@@ -0,0 +1,123 @@
+import threading
+import llm_scheduler
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken is optional; fall back to a character estimate
+    _encoding = None
+
+# Tokens per message for role and formatting, as counted by the chat API
+MESSAGE_OVERHEAD = 4
+
+SUMMARY_PROMPT = (
+    "Summarize the following career-coaching conversation in under {limit} words. "
+    "Keep the user's situation, goals, feelings and any advice already given."
+)
+
+
+def count_tokens(text):
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return max(1, len(text) // 4)
+
+
+def count_message_tokens(messages):
+    return sum(count_tokens(m["content"]) + MESSAGE_OVERHEAD for m in messages)
+
+
+def summarize(previous_summary, messages, limit=120):
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+    if previous_summary:
+        transcript = f"Earlier summary: {previous_summary}\n{transcript}"
+    # Background priority: ConversationContext refreshes the summary off the
+    # request path, so this call may wait behind interactive chat
+    return llm_scheduler.get_scheduler().complete(
+        [
+            {"role": "system", "content": SUMMARY_PROMPT.format(limit=limit)},
+            {"role": "user", "content": transcript}
+        ],
+        priority=llm_scheduler.BACKGROUND,
+        max_tokens=limit * 2,
+        temperature=0.2
+    ).strip()
+
+
+# Keeps each request within a token budget: the system prompt, a running
+# summary of older turns and as many recent turns as fit. Older turns are
+# folded into the summary once, when they leave the window, and the summary
+# is kept on this object (one per session) so it is never recomputed.
+# The fold runs on a background thread: a request goes out with the summary
+# as it stands plus the window, and never waits for the summarizer.
+class ConversationContext:
+    def __init__(self, budget=1500, summary_tokens=250, summarizer=summarize):
+        self.budget = budget
+        self.summary_tokens = summary_tokens
+        self.summarizer = summarizer
+        self.summary = ""
+        self.summarized_upto = 1
+        self._lock = threading.Lock()
+        self._refresher = None
+        self.last_request_tokens = 0
+        self.total_request_tokens = 0
+        self.requests = 0
+
+    def _eligible_turns(self, history):
+        # Canned empathy/action messages only matter for the turn they answer
+        last_user = max((i for i, m in enumerate(history) if m["role"] == "user"), default=len(history))
+        return [
+            (i, m) for i, m in enumerate(history)
+            if i > 0 and (not m.get("canned") or i > last_user)
+        ]
+
+    def build(self, history):
+        system = history[0]
+        turns = self._eligible_turns(history)
+
+        # Newest turns first, until the budget is spent (the latest turn is always kept)
+        available = self.budget - count_message_tokens([system]) - self.summary_tokens
+        window = []
+        for i, msg in reversed(turns):
+            cost = count_message_tokens([msg])
+            if window and cost > available:
+                break
+            window.insert(0, (i, msg))
+            available -= cost
+        cut = window[0][0] if window else len(history)
+
+        with self._lock:
+            summary = self.summary
+            pending = [m for i, m in turns if self.summarized_upto <= i < cut]
+            refresher = None
+            if pending and self._refresher is None:
+                refresher = self._refresher = threading.Thread(
+                    target=self._refresh, args=(summary, pending, cut), daemon=True
+                )
+        if refresher is not None:
+            refresher.start()
+
+        messages = [{"role": system["role"], "content": system["content"]}]
+        if summary:
+            messages.append({"role": "system", "content": f"Summary of the earlier conversation: {summary}"})
+        messages += [{"role": m["role"], "content": m["content"]} for _, m in window]
+
+        self.last_request_tokens = count_message_tokens(messages)
+        self.total_request_tokens += self.last_request_tokens
+        self.requests += 1
+        return messages
+
+    def _refresh(self, summary, pending, cut):
+        try:
+            summary = self.summarizer(summary, pending)
+        except Exception:
+            summary = None  # retried on the next turn
+        with self._lock:
+            if summary is not None:
+                self.summary, self.summarized_upto = summary, cut
+            self._refresher = None
+
+    def wait(self, timeout=None):
+        # Blocks until a summary refresh in progress (if any) has finished
+        refresher = self._refresher
+        if refresher is not None:
+            refresher.join(timeout)
@@ -1,12 +1,8 @@
 import streamlit as st
-import openai
 import random
-
-# OpenAI client setup
-client = openai.OpenAI(
-    api_key="sk-LMrDzMxd78EJxvT84EblDHgyEF9sO8m8eSrYw9Srf0jgeR2W",
-    base_url="https://api.chatanywhere.tech/v1"
-)
+import llm_scheduler
+import perf
+from chat_context import ConversationContext
 
 # Empathy & Action messages
 empathy_prompts = [
@@ -28,20 +24,29 @@ def detect_negative_emotion(user_input):
     return any(word in user_input.lower() for word in negative_keywords)
 
 # Generate AI response
-def generate_ai_response(messages):
+# Requests go through the shared scheduler: chat is served before roadmaps,
+# and while queued the caller's status placeholder shows its place in line
+def stream_ai_response(messages, status=None):
+    def on_wait(position):
+        if status is not None:
+            status.caption(f"⏳ Lots of people are chatting right now. You're #{position} in line...")
     try:
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=messages,
-            max_tokens=150,
-            temperature=0.7
+        response = llm_scheduler.get_scheduler().stream(
+            messages, model="gpt-4", priority=llm_scheduler.CHAT, max_tokens=150, temperature=0.7
         )
-        return response.choices[0].message.content.strip()
+        yield from response.iter(on_wait)
+    except llm_scheduler.SchedulerBusy:
+        yield "[Error]: The assistant is very busy right now. Please try again in a minute."
     except Exception as e:
-        return f"[Error]: {e}"
+        yield f"[Error]: {e}"
+    finally:
+        if status is not None:
+            status.empty()
 
 # Streamlit app setup
 st.set_page_config(page_title="Career Crisis Assistant", page_icon="🧭")
+perf.configure("chatbot")
+profiler = perf.start_profiler("chatbot", perf.profiling_requested(st.query_params))
 st.title(" Career Crisis Assistant")
 
 # Initialize session state
@@ -49,6 +54,9 @@ if "chat_history" not in st.session_state:
     st.session_state.chat_history = [
         {"role": "system", "content": "You are an empathetic career guidance coach who helps users navigate emotional career struggles with warmth, encouragement, and practical advice."}
     ]
+if "chat_context" not in st.session_state:
+    # Token budget for each request: system prompt + running summary + recent turns
+    st.session_state.chat_context = ConversationContext(budget=1500)
 
 # Chat container
 chat_container = st.container()
@@ -71,19 +79,33 @@ with input_container:
 
 # Handle new message
 if submit_button and user_input:
+    history_len = len(st.session_state.chat_history)
     st.session_state.chat_history.append({"role": "user", "content": user_input})
 
     # If negative emotion detected, provide empathy + action
     if detect_negative_emotion(user_input):
         empathy = random.choice(empathy_prompts)
         action = random.choice(action_suggestions)
-        st.session_state.chat_history.append({"role": "assistant", "content": empathy})
-        st.session_state.chat_history.append({"role": "assistant", "content": action})
+        st.session_state.chat_history.append({"role": "assistant", "content": empathy, "canned": True})
+        st.session_state.chat_history.append({"role": "assistant", "content": action, "canned": True})
 
-    # Then generate AI response
-    ai_response = generate_ai_response(st.session_state.chat_history)
-    st.session_state.chat_history.append({"role": "assistant", "content": ai_response})
+    # Then stream the AI response into the conversation as it arrives
+    messages = st.session_state.chat_context.build(st.session_state.chat_history)
+    with chat_container:
+        for msg in st.session_state.chat_history[history_len:]:
+            st.markdown(f"**{'You' if msg['role'] == 'user' else 'Assistant'}:** {msg['content']}")
+        st.markdown("**Assistant:**")
+        queue_status = st.empty()
+        ai_response = st.write_stream(stream_ai_response(messages, queue_status))
+    st.session_state.chat_history.append({"role": "assistant", "content": ai_response.strip()})
 
 # Footer prompt
 st.markdown("---")
 st.info("💡 You can continue chatting by typing your next message above.")
+context = st.session_state.chat_context
+if context.requests:
+    st.caption(f"Last request: {context.last_request_tokens} tokens · Session total: {context.total_request_tokens} tokens over {context.requests} requests")
+
+# Opt-in sampling profile of this rerun (?profile=1)
+if profiler:
+    st.caption(f"Profile written to {profiler.stop()}")
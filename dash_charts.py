@@ -0,0 +1,79 @@
+import os
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Upper bound on raw points shipped to the browser for any one trace
+MAX_POINTS_PER_TRACE = int(os.environ.get("ASCENDX_MAX_POINTS_PER_TRACE", "300"))
+BOX_COLORS = px.colors.qualitative.Plotly
+
+
+def payload_bytes(fig):
+    # Size of the figure JSON that st.plotly_chart sends to the browser.
+    # Serializes the figure again, so only call it when debugging.
+    return len(fig.to_json().encode("utf-8"))
+
+
+def weighted_quantiles(values, counts, qs):
+    # Linear-interpolated quantiles of the expanded sample, without expanding it
+    order = np.argsort(values)
+    values, cum = np.asarray(values)[order], np.cumsum(np.asarray(counts)[order])
+    positions = np.asarray(qs, dtype=float) * (cum[-1] - 1)
+    lower = values[np.searchsorted(cum, np.floor(positions), side='right')]
+    upper = values[np.searchsorted(cum, np.ceil(positions), side='right')]
+    return lower + (upper - lower) * (positions - np.floor(positions))
+
+
+def sample_points(values, counts, max_points=MAX_POINTS_PER_TRACE, seed=0):
+    values, counts = np.asarray(values), np.asarray(counts)
+    total = counts.sum()
+    if total <= max_points:
+        return np.repeat(values, counts)
+    # Fixed seed keeps the sample stable across reruns of the same filter
+    rng = np.random.default_rng(seed)
+    return rng.choice(values, size=max_points, p=counts / total)
+
+
+def histogram_figure(value_counts, column, nbins=10, **layout):
+    # value_counts: DataFrame of column -> count; bins are computed here, not in the browser
+    values, counts = value_counts[column].to_numpy(), value_counts['count'].to_numpy()
+    if len(values) == 0:
+        bins = pd.DataFrame({column: [], 'count': []})
+    else:
+        hist, edges = np.histogram(values, bins=nbins, weights=counts)
+        bins = pd.DataFrame({
+            column: [f"{lo:g}–{hi:g}" for lo, hi in zip(edges[:-1], edges[1:])],
+            'count': hist.astype(int)
+        })
+    fig = px.bar(bins, x=column, y='count', **layout)
+    fig.update_layout(bargap=0)
+    return fig
+
+
+def box_figure(value_counts, group, column, top_n=5, max_points=MAX_POINTS_PER_TRACE, template=None):
+    # One precomputed box per group plus at most max_points sampled points per group
+    sizes = value_counts.groupby(group, observed=True)['count'].sum()
+    groups = sizes[sizes > 0].nlargest(top_n).index
+
+    fig = go.Figure()
+    for i, name in enumerate(groups):
+        rows = value_counts[value_counts[group] == name]
+        values, counts = rows[column].to_numpy(dtype=float), rows['count'].to_numpy()
+        q1, median, q3 = weighted_quantiles(values, counts, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+        color = BOX_COLORS[i % len(BOX_COLORS)]
+        fig.add_trace(go.Box(
+            name=str(name), x=[str(name)], q1=[q1], median=[median], q3=[q3],
+            lowerfence=[inside.min()], upperfence=[inside.max()],
+            marker_color=color, boxpoints=False
+        ))
+        fig.add_trace(go.Box(
+            name=str(name), x=[str(name)] * min(max_points, int(counts.sum())),
+            y=sample_points(values, counts, max_points, seed=i),
+            boxpoints='all', jitter=0.3, pointpos=0, fillcolor='rgba(0,0,0,0)',
+            line_width=0, marker_color=color, hoveron='points', showlegend=False
+        ))
+    fig.update_layout(template=template, xaxis_title=group, yaxis_title=column, legend_title_text=group)
+    return fig
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+CUBE_KEYS = ['Job_Role', 'Location', 'Posted Week']
+
+# Same token shape WordCloud uses when it tokenizes raw text
+TOKEN_PATTERN = r"\w[\w']+"
+
+
+# Pre-aggregated view of the dashboard table, keyed by role x location x
+# posted-week bucket. Built once per data load; every filter change is then
+# answered by rolling up the (small) cube instead of rescanning the rows.
+class FilterCube:
+    def __init__(self, df, reference_time, text_column=None, stopwords=()):
+        self.reference_time = reference_time
+        weeks = (pd.Timestamp(reference_time) - df['Posted Date']).dt.days // 7
+        keyed = df[['Job_Role', 'Location', 'Company', 'Experience Min']].assign(**{'Posted Week': weeks})
+
+        self.cells = keyed.groupby(CUBE_KEYS, observed=True, dropna=False).agg(
+            count=('Job_Role', 'size'),
+            exp_sum=('Experience Min', 'sum'),
+            exp_count=('Experience Min', 'count')
+        ).reset_index()
+        # Per-cell company counts double as the company "set" for distinct counts
+        self.companies = (
+            keyed.groupby(CUBE_KEYS + ['Company'], observed=True)
+            .size().rename('count').reset_index()
+        )
+        # Per-cell experience value counts, for distributions computed server-side
+        self.experience = (
+            keyed.dropna(subset=['Experience Min'])
+            .groupby(CUBE_KEYS + ['Experience Min'], observed=True)
+            .size().rename('count').reset_index()
+        )
+        # Per-cell token frequencies, summed for any filter to feed the word cloud
+        self.terms = None
+        if text_column is not None:
+            self.terms = self._term_counts(df[text_column], keyed[CUBE_KEYS], set(stopwords))
+
+    @staticmethod
+    def _term_counts(text, keys, stopwords):
+        tokens = text.dropna().astype(str).str.lower().str.findall(TOKEN_PATTERN).explode().dropna()
+        tokens = tokens[~tokens.isin(stopwords) & ~tokens.str.isdigit()]
+        return (
+            keys.loc[tokens.index].assign(term=tokens.to_numpy())
+            .groupby(CUBE_KEYS + ['term'], observed=True)
+            .size().rename('count').reset_index()
+        )
+
+    def _select(self, table, role, locations, max_days):
+        mask = np.ones(len(table), dtype=bool)
+        if role != "All":
+            mask &= (table['Job_Role'] == role).to_numpy()
+        if locations:
+            mask &= table['Location'].isin(locations).to_numpy()
+        if max_days is not None:
+            mask &= (table['Posted Week'] * 7 < max_days).to_numpy()
+        return table[mask]
+
+    def slice(self, role="All", locations=None, max_days=None):
+        return CubeSlice(
+            self._select(self.cells, role, locations, max_days),
+            self._select(self.companies, role, locations, max_days),
+            self._select(self.experience, role, locations, max_days),
+            None if self.terms is None else self._select(self.terms, role, locations, max_days)
+        )
+
+
+class CubeSlice:
+    def __init__(self, cells, companies, experience, terms=None):
+        self.cells = cells
+        self.companies = companies
+        self.experience = experience
+        self.terms = terms
+
+    def total_jobs(self):
+        return int(self.cells['count'].sum())
+
+    def location_count(self):
+        return self.cells['Location'].nunique()
+
+    def company_count(self):
+        return self.companies['Company'].nunique()
+
+    def avg_experience(self):
+        exp_count = self.cells['exp_count'].sum()
+        return self.cells['exp_sum'].sum() / exp_count if exp_count else float('nan')
+
+    def top(self, column, n=10):
+        table = self.companies if column == 'Company' else self.cells
+        counts = table.groupby(column, observed=True)['count'].sum()
+        counts = counts[counts > 0].sort_values(ascending=False).head(n)
+        return counts.rename_axis(column).reset_index(name='Count')
+
+    def experience_counts(self):
+        # (Job_Role, Experience Min) -> number of postings
+        counts = self.experience.groupby(['Job_Role', 'Experience Min'], observed=True)['count'].sum()
+        return counts[counts > 0].reset_index()
+
+    def term_frequencies(self, max_words=200):
+        counts = self.terms.groupby('term')['count'].sum()
+        return counts.nlargest(max_words).to_dict()
@@ -0,0 +1,45 @@
+import os
+import pandas as pd
+from datetime import datetime
+
+RENAMES = {
+    'Job Title': 'Job_Role',
+    'Company': 'Company',
+    'Location': 'Location',
+    'Job Experience': 'Job Experience',
+    'Skills/Description': 'Skills/Description'
+}
+
+CATEGORY_COLUMNS = ['Location', 'Company', 'Job_Role']
+
+DATA_PATH = os.environ.get(
+    "ASCENDX_DASH_CSV", "C:\\Users\\sayed\\OneDrive\\Desktop\\Major PRO\\naukri_data_science_jobs_india.csv"
+)
+
+
+# --- Load and Preprocess Dataset ---
+# Returns the dashboard table; callers share it and must treat it as read-only.
+def load_job_table(path):
+    loaded_at = datetime.now()
+    df = pd.read_csv(path, usecols=lambda col: col in RENAMES)
+
+    # Rename columns to match expected names
+    df = df.rename(columns=RENAMES)
+
+    # One vectorized extract feeds both the experience and the simulated posted date
+    experience = df['Job Experience'].astype(str).str.extract(r'(\d+)', expand=False).astype(float)
+    df['Experience Min'] = experience
+    df['Posted Date'] = pd.Timestamp(loaded_at) - pd.to_timedelta(experience.fillna(2) * 7, unit='D')
+
+    # Clean columns
+    df['Location'] = df['Location'].astype(str).str.split(',').str[0].str.strip()
+    df['Job_Role'] = df['Job_Role'].astype(str).str.strip().str.title()
+    df = df.dropna(subset=['Location'])
+
+    # Low-cardinality text columns are stored once per distinct value
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype('category')
+
+    df = df.reset_index(drop=True)
+    df.attrs['loaded_at'] = loaded_at
+    return df
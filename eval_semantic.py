@@ -0,0 +1,75 @@
+import time
+import argparse
+import numpy as np
+import job_store
+import tfidf_index
+from job_search import JobSearchEngine
+from semantic_search import SemanticIndex, N_COMPONENTS
+
+
+def percentile_ms(samples, pct):
+    return float(np.percentile(samples, pct) * 1000) if samples else float("nan")
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def recall(found, truth):
+    return len(set(found) & set(truth)) / len(truth) if len(truth) else 1.0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare semantic ANN retrieval against the exact paths")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--components", type=int, default=N_COMPONENTS)
+    parser.add_argument("--lists", type=int, default=None)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--query-words", type=int, default=40, help="Queries are the first N words of sampled postings")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    df = job_store.load_corpus()
+    index = tfidf_index.sync_with_corpus(
+        tfidf_index.load_latest(), df['combined_text'].tolist(), df['listing_key'].tolist()
+    )
+    has_link = df['apply_link'].str.startswith("http").to_numpy()
+
+    lexical = JobSearchEngine(index.matrix, has_link)
+    semantic, build_time = timed(lambda: SemanticIndex(index.matrix, has_link, args.components, args.lists, args.seed))
+    print(f"Built semantic index over {len(df)} postings in {build_time:.1f}s "
+          f"({semantic.list_vectors.nbytes / 2**20:.1f} MiB vectors, {semantic.n_lists} lists)")
+
+    rng = np.random.default_rng(args.seed)
+    rows = rng.choice(len(df), size=min(args.queries, len(df)), replace=False)
+    queries = [index.transform([" ".join(df['combined_text'].iat[r].split()[:args.query_words])]) for r in rows]
+
+    # Ground truth: exact lexical top-k and exact (brute-force) semantic top-k, no threshold
+    lexical_truth, lexical_times, exact_truth, exact_times = [], [], [], []
+    for q in queries:
+        (ids, _, _), elapsed = timed(lambda: lexical.search(q, k=args.k, threshold=0.0))
+        lexical_truth.append(ids)
+        lexical_times.append(elapsed)
+        (ids, _, _), elapsed = timed(lambda: semantic.search(q, k=args.k, threshold=-1.0, exact=True))
+        exact_truth.append(ids)
+        exact_times.append(elapsed)
+
+    print(f"\n{'path':<18}{'recall@k (ANN)':>16}{'overlap@k (lex)':>17}{'p50 ms':>9}{'p95 ms':>9}")
+    print(f"{'lexical exact':<18}{'-':>16}{1.0:>17.3f}"
+          f"{percentile_ms(lexical_times, 50):>9.2f}{percentile_ms(lexical_times, 95):>9.2f}")
+    exact_overlap = np.mean([recall(e, l) for e, l in zip(exact_truth, lexical_truth)])
+    print(f"{'semantic exact':<18}{1.0:>16.3f}{exact_overlap:>17.3f}"
+          f"{percentile_ms(exact_times, 50):>9.2f}{percentile_ms(exact_times, 95):>9.2f}")
+
+    for nprobe in args.nprobe:
+        recalls, overlaps, times = [], [], []
+        for q, exact_ids, lexical_ids in zip(queries, exact_truth, lexical_truth):
+            (ids, _, _), elapsed = timed(lambda: semantic.search(q, k=args.k, threshold=-1.0, nprobe=nprobe))
+            recalls.append(recall(ids, exact_ids))
+            overlaps.append(recall(ids, lexical_ids))
+            times.append(elapsed)
+        print(f"{f'ANN nprobe={nprobe}':<18}{np.mean(recalls):>16.3f}{np.mean(overlaps):>17.3f}"
+              f"{percentile_ms(times, 50):>9.2f}{percentile_ms(times, 95):>9.2f}")
@@ -0,0 +1,136 @@
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for the OpenAI-compatible chat completions endpoint, used to
+# measure chatbot.py / quro.py offline (ASCENDX_LLM_BACKEND=local).
+WORDS = (
+    "build projects learn python sql statistics portfolio network mentor apply "
+    "interview practice resume skills course week month goal review data analyst "
+    "dashboard model cloud deploy git team feedback plan progress"
+).split()
+
+
+class FakeLLMConfig:
+    def __init__(self, latency=0.3, jitter=0.1, tokens_per_sec=40.0, completion_tokens=120,
+                 error_rate=0.0, rate_limit_rate=0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.tokens_per_sec = tokens_per_sec
+        self.completion_tokens = completion_tokens
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.requests = 0
+        self.lock = threading.Lock()
+
+
+def make_handler(config):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status, body, headers=None):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self._send_json(404, {"error": {"message": "not found"}})
+                return
+            with config.lock:
+                config.requests += 1
+
+            roll = random.random()
+            if roll < config.rate_limit_rate:
+                self._send_json(429, {"error": {"message": "rate limited", "type": "rate_limit"}},
+                                {"Retry-After": "1"})
+                return
+            if roll < config.rate_limit_rate + config.error_rate:
+                self._send_json(500, {"error": {"message": "injected failure", "type": "server_error"}})
+                return
+
+            time.sleep(max(0.0, config.latency + random.uniform(-config.jitter, config.jitter)))
+            n_tokens = min(body.get("max_tokens") or config.completion_tokens, config.completion_tokens)
+            tokens = [random.choice(WORDS) + " " for _ in range(n_tokens)]
+            model = body.get("model", "fake")
+            if body.get("stream"):
+                self._stream(model, tokens)
+            else:
+                time.sleep(n_tokens / config.tokens_per_sec)
+                self._send_json(200, {
+                    "id": "chatcmpl-fake", "object": "chat.completion", "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": "".join(tokens)}}],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": n_tokens, "total_tokens": n_tokens},
+                })
+
+        def _stream(self, model, tokens):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            def event(delta, finish_reason=None):
+                payload = {
+                    "id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                }
+                self._chunk(f"data: {json.dumps(payload)}\n\n")
+
+            event({"role": "assistant", "content": ""})
+            for token in tokens:
+                time.sleep(1.0 / config.tokens_per_sec)
+                event({"content": token})
+            event({}, "stop")
+            self._chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+
+        def _chunk(self, text):
+            data = text.encode("utf-8")
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+
+    return Handler
+
+
+def serve(host="127.0.0.1", port=8008, config=None):
+    server = ThreadingHTTPServer((host, port), make_handler(config or FakeLLMConfig()))
+    server.daemon_threads = True
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible chat server for offline load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8008)
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds before the first token")
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--tokens-per-sec", type=float, default=40.0)
+    parser.add_argument("--completion-tokens", type=int, default=120)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    args = parser.parse_args()
+
+    config = FakeLLMConfig(args.latency, args.jitter, args.tokens_per_sec, args.completion_tokens,
+                           args.error_rate, args.rate_limit_rate)
+    server = serve(args.host, args.port, config)
+    print(f"Fake LLM server on http://{args.host}:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
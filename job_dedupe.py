@@ -0,0 +1,175 @@
+import zlib
+import sqlite3
+import hashlib
+import numpy as np
+
+# MinHash / LSH settings: 16 bands x 4 rows catches pairs above ~0.5 Jaccard
+# with high probability; THRESHOLD then decides on the estimated similarity.
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+THRESHOLD = 0.8
+
+_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(20240501)
+_A = _rng.integers(1, int(_PRIME), NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, int(_PRIME), NUM_PERM, dtype=np.uint64)
+
+
+def _shingles(text):
+    words = text.split()
+    if len(words) <= SHINGLE_SIZE:
+        grams = {" ".join(words)}
+    else:
+        grams = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64) % _PRIME
+
+
+def minhash(text):
+    hashes = (np.outer(_shingles(text), _A) + _B) % _PRIME
+    return hashes.min(axis=0).astype(np.uint32)
+
+
+def signatures(texts):
+    texts = list(texts)
+    if not texts:
+        return np.empty((0, NUM_PERM), dtype=np.uint32)
+    return np.vstack([minhash(text) for text in texts])
+
+
+def exact_keys(df):
+    # title|company|location, or None when any part is blank: postings that
+    # lack a company or location are only ever matched on their text
+    parts = [df[col].str.lower().str.strip() for col in ('job_title', 'company_name', 'job_location')]
+    blank = np.logical_or.reduce([(part == '').to_numpy() for part in parts])
+    keys = (parts[0] + '|' + parts[1] + '|' + parts[2]).tolist()
+    return [None if is_blank else key for key, is_blank in zip(keys, blank)]
+
+
+def bucket_ids(signature):
+    # One signed 64-bit id per LSH band (the band number is part of the hash)
+    return [
+        int.from_bytes(
+            hashlib.blake2b(bytes([b]) + signature[b * ROWS_PER_BAND:(b + 1) * ROWS_PER_BAND].tobytes(),
+                            digest_size=8).digest(),
+            'big', signed=True
+        )
+        for b in range(BANDS)
+    ]
+
+
+def is_similar(a, b):
+    return np.mean(a == b) >= THRESHOLD
+
+
+# Exact keys, LSH band buckets and signatures of every stored posting, kept
+# in SQLite next to the store parts. An ingest looks up only its own rows'
+# keys and buckets instead of re-bucketing everything already stored.
+class ClusterIndex:
+    def __init__(self, path):
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=30)
+        with self._db:
+            self._db.executescript(
+                "CREATE TABLE IF NOT EXISTS postings ("
+                "row INTEGER PRIMARY KEY, cluster_id TEXT NOT NULL, signature BLOB NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS exact_keys (key TEXT PRIMARY KEY, cluster_id TEXT NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "bucket INTEGER NOT NULL, row INTEGER NOT NULL, PRIMARY KEY (bucket, row)) WITHOUT ROWID;"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._db.close()
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def clear(self):
+        with self._db:
+            for table in ("postings", "exact_keys", "buckets"):
+                self._db.execute(f"DELETE FROM {table}")
+
+    def exact_cluster(self, key):
+        row = self._db.execute("SELECT cluster_id FROM exact_keys WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def similar_cluster(self, buckets, signature):
+        # Cluster of the earliest stored posting sharing a band with signature
+        # and an estimated Jaccard >= THRESHOLD
+        rows = self._db.execute(
+            "SELECT cluster_id, signature FROM postings WHERE row IN "
+            f"(SELECT row FROM buckets WHERE bucket IN ({','.join('?' * len(buckets))})) ORDER BY row",
+            buckets
+        )
+        for cluster_id, stored in rows:
+            if is_similar(np.frombuffer(stored, dtype=np.uint32), signature):
+                return cluster_id
+        return None
+
+    def add(self, df, signatures):
+        # df: postings with cluster_id assigned, in store order after those already held
+        start = len(self)
+        signatures = np.asarray(signatures, dtype=np.uint32)
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO postings (row, cluster_id, signature) VALUES (?, ?, ?)",
+                ((start + i, cluster_id, signature.tobytes())
+                 for i, (cluster_id, signature) in enumerate(zip(df['cluster_id'], signatures)))
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO exact_keys (key, cluster_id) VALUES (?, ?)",
+                ((key, cluster_id) for key, cluster_id in zip(exact_keys(df), df['cluster_id']) if key is not None)
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO buckets (bucket, row) VALUES (?, ?)",
+                ((bucket, start + i) for i, signature in enumerate(signatures) for bucket in bucket_ids(signature))
+            )
+
+
+def assign_clusters(new_df, new_signatures, index=None):
+    # Adds cluster_id / is_representative to new_df. Rows join the cluster of the
+    # first earlier posting (already stored in index, or earlier in this batch)
+    # with the same title/company/location or an estimated Jaccard >= THRESHOLD;
+    # otherwise they start a cluster named after their own listing_key.
+    buckets = {}
+    exact = {}
+    cluster_of = []
+    batch_signatures = []
+
+    cluster_ids, representative = [], []
+    for key, signature, listing_key in zip(exact_keys(new_df), new_signatures, new_df['listing_key']):
+        signature = np.asarray(signature)
+        bands = bucket_ids(signature)
+        match = None
+        if key is not None:
+            match = index.exact_cluster(key) if index is not None else None
+            if match is None and key in exact:
+                match = cluster_of[exact[key]]
+        if match is None and index is not None:
+            match = index.similar_cluster(bands, signature)
+        if match is None:
+            for row in sorted({row for band in bands for row in buckets.get(band, ())}):
+                if is_similar(batch_signatures[row], signature):
+                    match = cluster_of[row]
+                    break
+
+        cluster_id = listing_key if match is None else match
+        cluster_ids.append(cluster_id)
+        representative.append(match is None)
+
+        row = len(cluster_of)
+        if key is not None:
+            exact.setdefault(key, row)
+        for band in bands:
+            buckets.setdefault(band, []).append(row)
+        cluster_of.append(cluster_id)
+        batch_signatures.append(signature)
+
+    return new_df.assign(cluster_id=cluster_ids, is_representative=representative)
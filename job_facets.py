@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+# Posted-date buckets offered as filters: label -> maximum age in days
+POSTED_BUCKETS = {"Last 24 hours": 1, "Last week": 7, "Last month": 30}
+EXPERIENCE_LEVELS = ("Fresher", "Experienced")
+
+YEARS_PATTERN = r'(\d{1,2})\s*(?:\+|-\s*\d{1,2}|to\s*\d{1,2})?\s*(?:years?|yrs?)'
+FRESHER_PATTERN = r'\b(?:fresher|freshers|entry[- ]level|intern|internship|graduate|trainee|junior)\b'
+EXPERIENCED_PATTERN = r'\b(?:senior|sr\.?|lead|principal|manager|experienced)\b'
+RELATIVE_PATTERN = r'(\d+)\s*(hour|day|week|month)s?\s+ago'
+UNIT_DAYS = {'hour': 1 / 24, 'day': 1, 'week': 7, 'month': 30}
+
+
+def normalize_city(locations):
+    # "mumbai, maharashtra, india" -> "mumbai"
+    return locations.str.split(',').str[0].str.strip()
+
+
+def posted_age_days(posted, reference_time):
+    # Age in days of each posting; NaN where the date cannot be read.
+    # Handles absolute dates and "3 days ago" style strings. The corpus merges
+    # sources with different date formats, so each value is parsed on its own.
+    absolute = pd.to_datetime(posted, errors='coerce', utc=True, format='mixed').dt.tz_localize(None)
+    age = (pd.Timestamp(reference_time) - absolute).dt.total_seconds() / 86400
+
+    relative = posted.str.lower().str.extract(RELATIVE_PATTERN)
+    relative_age = relative[0].astype(float) * relative[1].map(UNIT_DAYS)
+    age = age.fillna(relative_age)
+    age = age.mask(posted.str.contains(r'\b(?:today|just now)\b', case=False), 0.0)
+    age = age.mask(posted.str.contains(r'\byesterday\b', case=False), 1.0)
+    return age.to_numpy(dtype=float)
+
+
+def _epoch_seconds(moment):
+    # Naive datetimes are read the same way at build and query time
+    return pd.Timestamp(moment).timestamp()
+
+
+def experience_bands(df):
+    # (fresher, experienced) bitmaps; a posting matching neither is unknown.
+    # Stated years win over keywords.
+    text = df['job_title'] + ' ' + df['job_description']
+    years = text.str.extract(YEARS_PATTERN, expand=False).astype(float)
+    fresher_word = df['job_title'].str.contains(FRESHER_PATTERN) | df['job_description'].str.contains(FRESHER_PATTERN)
+    experienced_word = df['job_title'].str.contains(EXPERIENCED_PATTERN)
+
+    fresher = np.where(years.notna(), years <= 1, fresher_word)
+    experienced = np.where(years.notna(), years >= 2, experienced_word & ~fresher_word)
+    return fresher.astype(bool), experienced.astype(bool)
+
+
+# Boolean facet columns built once per corpus. Filters are combined into one
+# eligibility mask that the search engines apply before computing similarity.
+class FacetIndex:
+    def __init__(self, df, reference_time=None):
+        self.reference_time = reference_time or datetime.now()
+        self.n_docs = len(df)
+        self.remote = df['job_location'].str.contains("remote", regex=False).to_numpy()
+        self.has_link = df['apply_link'].str.startswith("http").to_numpy()
+
+        cities = pd.Categorical(normalize_city(df['job_location']))
+        self.city_codes = cities.codes
+        self.city_lookup = {city: code for code, city in enumerate(cities.categories)}
+
+        # Posting times in epoch seconds (NaN when unknown). Age filters compare
+        # them with the clock at query time, so they stay right in a long-lived
+        # process.
+        age = posted_age_days(df['job_posted_date'], self.reference_time)
+        self.posted_at = _epoch_seconds(self.reference_time) - age * 86400
+
+        fresher, experienced = experience_bands(df)
+        self.experience = {"Fresher": fresher, "Experienced": experienced}
+
+    def parse_locations(self, text):
+        # Comma-separated user input -> (known city names, unknown names, wants remote)
+        names = [name.strip().lower() for name in text.split(',') if name.strip()]
+        wants_remote = "remote" in names
+        names = [name for name in names if name != "remote"]
+        known = [name for name in names if name in self.city_lookup]
+        unknown = [name for name in names if name not in self.city_lookup]
+        return known, unknown, wants_remote
+
+    def mask(self, cities=(), remote=False, experience=None, max_age_days=None, now=None):
+        # Intersection of the requested filters, or None when nothing filters
+        masks = []
+        if cities or remote:
+            location = np.isin(self.city_codes, [self.city_lookup[city] for city in cities])
+            masks.append(location | self.remote if remote else location)
+        if experience in self.experience:
+            # Unknown postings stay eligible; only the opposite band is excluded
+            other = next(level for level in EXPERIENCE_LEVELS if level != experience)
+            masks.append(~self.experience[other])
+        if max_age_days is not None:
+            age_seconds = _epoch_seconds(now or datetime.now()) - self.posted_at
+            with np.errstate(invalid='ignore'):
+                masks.append(age_seconds <= max_age_days * 86400)
+        if not masks:
+            return None
+        return np.logical_and.reduce(masks)
@@ -0,0 +1,74 @@
+import numpy as np
+
+
+# Top-k retrieval over an inverted index of TF-IDF postings.
+# Rows of the TF-IDF matrix are L2-normalized, so the dot product of a query
+# with a document is their cosine similarity; only documents sharing at least
+# one term with the query are ever touched.
+class JobSearchEngine:
+    def __init__(self, tfidf_matrix, has_link):
+        # term -> (doc ids, weights)
+        self.postings = tfidf_matrix.T.tocsr()
+        self.matrix = tfidf_matrix.tocsr()
+        self.row_nnz = np.diff(self.matrix.indptr)
+        self.has_link = np.asarray(has_link, dtype=bool)
+        self.n_docs = tfidf_matrix.shape[0]
+
+    def score(self, query_vector, mask=None):
+        # mask: optional boolean eligibility per document; ineligible docs are never scored
+        query = query_vector.tocsr()
+        terms, weights = query.indices, query.data
+        if len(terms) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        if mask is not None:
+            # Filtered queries walk whichever is smaller: the eligible rows,
+            # or the postings lists of the query's terms
+            eligible = np.flatnonzero(mask)
+            postings_size = (self.postings.indptr[terms + 1] - self.postings.indptr[terms]).sum()
+            if self.row_nnz[eligible].sum() < postings_size:
+                return self.score_rows(eligible, terms, weights)
+
+        rows = self.postings[terms]
+        doc_ids = rows.indices
+        contrib = rows.data * np.repeat(weights, np.diff(rows.indptr))
+        if mask is not None:
+            keep = mask[doc_ids]
+            doc_ids, contrib = doc_ids[keep], contrib[keep]
+        candidates, inverse = np.unique(doc_ids, return_inverse=True)
+        return candidates, np.bincount(inverse, weights=contrib)
+
+    def score_rows(self, doc_ids, terms, weights):
+        # Dot products of the given rows with the query, matching each row's
+        # nonzeros against the query's terms (the query is never densified)
+        order = np.argsort(terms)
+        terms, weights = terms[order], weights[order]
+        rows = self.matrix[doc_ids]
+        position = np.minimum(np.searchsorted(terms, rows.indices), len(terms) - 1)
+        hit = terms[position] == rows.indices
+        owner = np.repeat(np.arange(len(doc_ids)), np.diff(rows.indptr))
+        scores = np.bincount(owner[hit], weights=rows.data[hit] * weights[position[hit]], minlength=len(doc_ids))
+        nonzero = scores > 0
+        return doc_ids[nonzero], scores[nonzero]
+
+    def search(self, query_vector, k=100, threshold=0.2, mask=None):
+        # Returns (doc ids, scores, number of docs above threshold)
+        candidates, scores = self.score(query_vector, mask)
+        return select_top_k(candidates, scores, self.has_link, k, threshold)
+
+
+def select_top_k(candidates, scores, has_link, k=100, threshold=0.2, mask=None):
+    keep = scores > threshold
+    if mask is not None:
+        keep &= np.asarray(mask, dtype=bool)[candidates]
+    candidates, scores = candidates[keep], scores[keep]
+    total = len(candidates)
+
+    # Linked postings rank first, then by score (scores never exceed 1)
+    rank_key = has_link[candidates] * 2.0 + scores
+    if k is not None and total > k:
+        top = np.argpartition(-rank_key, k - 1)[:k]
+        candidates, scores, rank_key = candidates[top], scores[top], rank_key[top]
+
+    order = np.argsort(-rank_key, kind='stable')
+    return candidates[order], scores[order], total
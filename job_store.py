@@ -0,0 +1,204 @@
+import os
+import glob
+import hashlib
+import argparse
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import numpy as np
+import job_dedupe
+
+# Raw sources (override through the environment)
+MERGED_CSV = os.environ.get(
+    "ASCENDX_MERGED_CSV", "C:\\Users\\sayed\\OneDrive\\Desktop\\Major PRO\\merged_job_listings.csv"
+)
+SKILLS_CSV = os.environ.get(
+    "ASCENDX_SKILLS_CSV", "C:\\Users\\sayed\\OneDrive\\Desktop\\Major PRO\\CareerCompass_jobs_with_skills.csv"
+)
+
+# Preprocessed columnar store (one parquet file per ingest, plus its MinHash
+# signatures, and a SQLite index of exact keys and LSH buckets for dedupe)
+STORE_DIR = os.environ.get("ASCENDX_JOB_STORE", "job_store")
+
+TEXT_COLUMNS = ['job_title', 'required_skills', 'job_description', 'job_location']
+DERIVED_COLUMNS = ('combined_text', 'listing_key', 'cluster_id', 'is_representative')
+
+MERGED_RENAMES = {
+    'company': 'company_name',
+    'location': 'job_location',
+    'description': 'job_description',
+    'link': 'apply_link',
+    'skills': 'required_skills',
+    'date_posted': 'job_posted_date'
+}
+
+SKILLS_RENAMES = {
+    'job_summary': 'job_description',
+    'job_location': 'job_location'
+}
+
+SOURCES = {
+    'merged': MERGED_RENAMES,
+    'skills': SKILLS_RENAMES
+}
+
+
+# --- Normalization ---
+def _listing_key(df):
+    parts = (
+        df['job_title'] + '|' + df['company_name'].str.lower().str.strip() + '|' +
+        df['job_location'] + '|' + df['apply_link'].str.strip()
+    )
+    return [hashlib.sha1(p.encode('utf-8')).hexdigest() for p in parts]
+
+
+def normalize_listings(frames, columns=None):
+    # frames: list of (source, raw DataFrame) pairs
+    renamed = [raw.rename(columns=SOURCES[source]) for source, raw in frames]
+
+    if columns is None:
+        columns = set()
+        for part in renamed:
+            columns.update(part.columns)
+        columns.update(TEXT_COLUMNS + ['company_name', 'apply_link', 'job_posted_date'])
+        columns = sorted(columns - set(DERIVED_COLUMNS))
+
+    df = pd.concat([part.reindex(columns=columns) for part in renamed], ignore_index=True)
+
+    # Every column is kept as text so all parts share one schema
+    df = df.fillna('').astype(str)
+    for col in TEXT_COLUMNS:
+        df[col] = df[col].str.lower().str.strip()
+
+    df['combined_text'] = (
+        df['job_title'] + ' ' +
+        df['required_skills'] + ' ' +
+        df['job_description'] + ' ' +
+        df['job_location']
+    )
+    df['listing_key'] = _listing_key(df)
+    return df
+
+
+# --- Store I/O ---
+def _part_paths(store_dir=STORE_DIR):
+    return sorted(glob.glob(os.path.join(store_dir, "part-*.parquet")))
+
+
+def store_version(store_dir=STORE_DIR):
+    # Changes whenever a part is added or rewritten (a rebuild reuses part-00000),
+    # so it can be used as a cache key
+    version = []
+    for path in _part_paths(store_dir):
+        stat = os.stat(path)
+        version.append((os.path.basename(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+
+def _store_columns(store_dir=STORE_DIR):
+    schema = pq.read_schema(_part_paths(store_dir)[0])
+    return [name for name in schema.names if name not in DERIVED_COLUMNS]
+
+
+def _signature_path(part_path):
+    return part_path[:-len(".parquet")] + ".minhash.npy"
+
+
+def _write_part(df, signatures, store_dir=STORE_DIR):
+    os.makedirs(store_dir, exist_ok=True)
+    path = os.path.join(store_dir, f"part-{len(_part_paths(store_dir)):05d}.parquet")
+    # Signatures land first so a visible part always has them
+    with open(_signature_path(path), "wb") as f:
+        np.save(f, signatures)
+    tmp_path = path + ".tmp"
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _cluster_index(store_dir=STORE_DIR):
+    # Derived from the parts and their signatures; rebuilt once if it is
+    # missing or out of step with them (e.g. after an interrupted ingest)
+    os.makedirs(store_dir, exist_ok=True)
+    index = job_dedupe.ClusterIndex(os.path.join(store_dir, "clusters.sqlite3"))
+    parts = _part_paths(store_dir)
+    if len(index) != sum(pq.read_metadata(p).num_rows for p in parts):
+        index.clear()
+        if parts:
+            existing = pq.read_table(
+                parts, columns=['job_title', 'company_name', 'job_location', 'cluster_id'], memory_map=True
+            ).to_pandas()
+            index.add(existing, np.concatenate([np.load(_signature_path(p)) for p in parts]))
+    return index
+
+
+def _append(df, store_dir=STORE_DIR):
+    # Near-duplicate clusters are assigned at ingest, against everything already stored
+    signatures = job_dedupe.signatures(df['combined_text'])
+    with _cluster_index(store_dir) as index:
+        df = job_dedupe.assign_clusters(df, signatures, index)
+        _write_part(df, signatures, store_dir)
+        index.add(df, signatures)
+    return len(df)
+
+
+def build_store(merged_csv=MERGED_CSV, skills_csv=SKILLS_CSV, store_dir=STORE_DIR):
+    for path in _part_paths(store_dir):
+        os.remove(path)
+        if os.path.exists(_signature_path(path)):
+            os.remove(_signature_path(path))
+    df = normalize_listings([
+        ('merged', pd.read_csv(merged_csv)),
+        ('skills', pd.read_csv(skills_csv))
+    ])
+    return _append(df, store_dir)
+
+
+def ingest(csv_path, source, store_dir=STORE_DIR):
+    if not _part_paths(store_dir):
+        return _append(normalize_listings([(source, pd.read_csv(csv_path))]), store_dir)
+
+    df = normalize_listings([(source, pd.read_csv(csv_path))], columns=_store_columns(store_dir))
+
+    # Only the key column is read back to find listings we already hold
+    known = pq.read_table(_part_paths(store_dir), columns=['listing_key'], memory_map=True).column('listing_key')
+    new_rows = df[~df['listing_key'].isin(set(known.to_pylist()))]
+    new_rows = new_rows.drop_duplicates(subset='listing_key')
+    if new_rows.empty:
+        return 0
+    return _append(new_rows, store_dir)
+
+
+def load_corpus(store_dir=STORE_DIR, representatives_only=True):
+    if not _part_paths(store_dir):
+        build_store(store_dir=store_dir)
+    # Memory-mapped reads skip an extra buffered copy of the file; to_pandas()
+    # still materializes one copy of the corpus per process.
+    # Parts are append-only and clusters never change once stored, so the
+    # representative rows also only ever grow at the end.
+    filters = [('is_representative', '=', True)] if representatives_only else None
+    table = pq.read_table(_part_paths(store_dir), memory_map=True, filters=filters)
+    return table.to_pandas()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the preprocessed job corpus store")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build_cmd = sub.add_parser("build", help="Rebuild the store from the raw CSVs")
+    build_cmd.add_argument("--merged", default=MERGED_CSV)
+    build_cmd.add_argument("--skills", default=SKILLS_CSV)
+
+    ingest_cmd = sub.add_parser("ingest", help="Append only new listings from a CSV")
+    ingest_cmd.add_argument("csv")
+    ingest_cmd.add_argument("--source", choices=sorted(SOURCES), default="merged")
+
+    parser.add_argument("--store", default=STORE_DIR)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        print(f"Stored {build_store(args.merged, args.skills, args.store)} listings in {args.store}")
+    else:
+        print(f"Appended {ingest(args.csv, args.source, args.store)} new listings to {args.store}")
+    flags = pq.read_table(_part_paths(args.store), columns=['is_representative']).column(0).to_pylist()
+    print(f"{sum(flags)} of {len(flags)} stored listings are cluster representatives")
@@ -1,61 +1,48 @@
 import streamlit as st
-import pandas as pd
-import fitz  # PyMuPDF
-import docx
-import spacy
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-
-# Load NLP model
-nlp = spacy.load("en_core_web_sm")
+import job_store
+import job_search
+import hashlib
+from datetime import datetime
+import resume_ingest
+import perf
+import resources
+from job_facets import FacetIndex, POSTED_BUCKETS
 
 st.set_page_config(page_title=" Smart Job Recommender", layout="wide")
+perf.configure("job_sugg")
+profiler = perf.start_profiler("job_sugg", perf.profiling_requested(st.query_params))
+
+# Load data: the preprocessed corpus and its TF-IDF index are shared process-wide;
+# the version keys pick up new ingests and newly published index snapshots
+store_version = job_store.store_version()
+df = resources.get("job_corpus", store_version)
+vectorizer = resources.get("tfidf_index", store_version, resources.snapshot_version())
+tfidf_matrix = vectorizer.matrix
+
+# Facet bitmaps (remote, has-link, city, posted bucket, experience band),
+# built once per corpus version and used to pre-filter queries before scoring.
+# Only the current version is kept: a new snapshot evicts the previous one.
+@st.cache_resource(max_entries=1)
+def get_facets(_df, store_version):
+    return FacetIndex(_df)
+
+facets = get_facets(df, store_version)
+
+@st.cache_resource(max_entries=1)
+def get_search_engine(_matrix, _has_link, store_version, index_version):
+    return job_search.JobSearchEngine(_matrix, _has_link)
+
+search_engine = get_search_engine(tfidf_matrix, facets.has_link, store_version, vectorizer.version)
+
+# Optional semantic mode: LSA vectors behind an approximate nearest-neighbour
+# index, built on first use only
+@st.cache_resource(max_entries=1, show_spinner="Building semantic index...")
+def get_semantic_index(_matrix, _has_link, store_version, index_version):
+    from semantic_search import SemanticIndex
+    return SemanticIndex(_matrix, _has_link)
+
+SEMANTIC_THRESHOLD = 0.3
 
-# Load data
-@st.cache_data
-def load_data():
-    df1 = pd.read_csv("C:\\Users\sayed\OneDrive\Desktop\Major PRO\\merged_job_listings.csv")
-    df2 = pd.read_csv("C:\\Users\sayed\OneDrive\Desktop\Major PRO\\CareerCompass_jobs_with_skills.csv")
-
-    df1 = df1.rename(columns={
-        'company': 'company_name',
-        'location': 'job_location',
-        'description': 'job_description',
-        'link': 'apply_link',
-        'skills': 'required_skills',
-        'date_posted': 'job_posted_date'
-    })
-
-    df2 = df2.rename(columns={
-        'job_summary': 'job_description',
-        'job_location': 'job_location'
-    })
-
-    for col in set(df1.columns).union(df2.columns):
-        df1[col] = df1.get(col, '')
-        df2[col] = df2.get(col, '')
-
-    df = pd.concat([df1, df2], ignore_index=True)
-    for col in ['job_title', 'required_skills', 'job_description', 'job_location']:
-        df[col] = df[col].fillna('').str.lower().str.strip()
-
-    df['combined_text'] = (
-        df['job_title'] + ' ' +
-        df['required_skills'] + ' ' +
-        df['job_description'] + ' ' +
-        df['job_location']
-    )
-    return df
-
-df = load_data()
-
-@st.cache_resource
-def get_vectorizer_matrix(df):
-    vectorizer = TfidfVectorizer(stop_words='english', max_features=5000)
-    matrix = vectorizer.fit_transform(df['combined_text'])
-    return vectorizer, matrix
-
-vectorizer, tfidf_matrix = get_vectorizer_matrix(df)
 
 # Custom CSS
 st.markdown("""
@@ -83,34 +70,6 @@ st.markdown("""
 # Header
 st.markdown('<div class="main-title"> Resume & Preference Based Job Recommender</div>', unsafe_allow_html=True)
 
-# Resume Parsing
-def extract_text_from_pdf(file):
-    doc = fitz.open(stream=file.read(), filetype="pdf")
-    return " ".join([page.get_text() for page in doc])
-
-def extract_text_from_docx(file):
-    doc = docx.Document(file)
-    return " ".join([para.text for para in doc.paragraphs])
-
-def extract_resume_info(text):
-    doc = nlp(text)
-    skills_list = [
-        'python', 'java', 'c++', 'sql', 'excel', 'machine learning',
-        'deep learning', 'pytorch', 'tensorflow', 'data analysis', 'cloud',
-        'aws', 'azure', 'git', 'react', 'html', 'css', 'javascript'
-    ]
-    skills = list({token.text.lower() for token in doc if token.text.lower() in skills_list})
-
-    education = []
-    for ent in doc.ents:
-        if ent.label_ == "ORG" and "university" in ent.text.lower():
-            education.append(ent.text)
-
-    return {
-        "skills": ", ".join(skills),
-        "education": ", ".join(education)
-    }
-
 # Form UI
 with st.form("preference_form"):
     st.subheader("📝 Enter Your Preferences")
@@ -128,53 +87,115 @@ with st.form("preference_form"):
         career_objective = st.text_area("Career Objective (3–5 lines)", height=100)
     with col4:
         remote_only = st.checkbox("Remote Only")
+        posted_within = st.selectbox("Posted", ["Any time", *POSTED_BUCKETS])
+        semantic_mode = st.checkbox("Semantic matching", help="Match on meaning rather than exact keywords")
 
     resume = st.file_uploader("📤 Upload Resume (PDF or DOCX)", type=['pdf', 'docx'])
     submit_btn = st.form_submit_button("🔎 Find Matching Jobs")
 
+PAGE_SIZE = 20
+
+# Ranked results are cached per query fingerprint (resume content + preferences
+# + index versions). Location, experience level and posting age are hard
+# filters intersected before scoring. The remote toggle and paging are applied
+# to the cached ranking, so flipping pages or toggling "Remote Only" neither
+# re-parses the resume nor re-scores the corpus.
+@st.cache_data(max_entries=64, show_spinner=False)
+def rank_query(resume_digest, _resume_bytes, resume_name, preferences, semantic_mode, posted_within,
+               store_version, index_version, posted_as_of=None):
+    job_type, preferred_skills, experience_level, location, career_objective = preferences
+    # A pool worker parses the resume while this thread builds the filters
+    # (and, in semantic mode, loads the semantic index); resume_parse only
+    # counts the time spent still waiting for the worker afterwards
+    parsing = resume_ingest.submit_upload(_resume_bytes, resume_name, resources.get("resume_pool"))
+    with perf.stage("facet_mask"):
+        cities, _, wants_remote = facets.parse_locations(location)
+        mask = facets.mask(cities, wants_remote, experience_level, POSTED_BUCKETS.get(posted_within))
+    if semantic_mode:
+        with perf.stage("semantic_index_load"):
+            semantic_index = get_semantic_index(tfidf_matrix, facets.has_link, store_version, index_version)
+    with perf.stage("resume_parse"):
+        parsed_resume = parsing.result(timeout=resume_ingest.UPLOAD_TIMEOUT)
+    user_input_text = " ".join([
+        job_type, preferred_skills, career_objective, parsed_resume["skills"], parsed_resume["education"]
+    ]).lower()
+
+    user_vector = vectorizer.transform([user_input_text])
+    with perf.stage("similarity_scoring", mode="semantic" if semantic_mode else "lexical"):
+        if semantic_mode:
+            doc_ids, scores, _ = semantic_index.search(user_vector, k=None, threshold=SEMANTIC_THRESHOLD, mask=mask)
+        else:
+            doc_ids, scores, _ = search_engine.search(user_vector, k=None, threshold=0.2, mask=mask)
+    return doc_ids, scores
+
+def render_results(doc_ids, scores):
+    total_matches = len(doc_ids)
+    st.success(f"✅ Found {total_matches} matching job(s).")
+    if total_matches == 0:
+        st.info("❌ No matching jobs found. Try different inputs.")
+        return
+
+    n_pages = (total_matches - 1) // PAGE_SIZE + 1
+    st.session_state.results_page = min(st.session_state.get("results_page", 1), n_pages)
+    page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, key="results_page")
+    start = (page - 1) * PAGE_SIZE
+    page_ids = doc_ids[start:start + PAGE_SIZE]
+    st.caption(f"Showing matches {start + 1}–{start + len(page_ids)} of {total_matches}.")
+
+    # Only the current page is materialized and rendered
+    page_matches = df.iloc[page_ids].assign(similarity_score=scores[start:start + PAGE_SIZE])
+    for _, row in page_matches.iterrows():
+        with st.expander(f"🔹 {row['job_title'].title()} at {row['company_name']}"):
+            st.markdown(f"""
+                <div class="job-card">
+                    <p><strong>Location:</strong> {row['job_location'].title()}</p>
+                    <p><strong>Skills:</strong> {row['required_skills']}</p>
+                    <p><strong>Description:</strong> {row['job_description'][:300]}...</p>
+                    <p><strong>Match Score:</strong> {row['similarity_score']:.2f}</p>
+                    <p><strong>Apply:</strong> <a href="{row['apply_link']}" target="_blank">{row['apply_link']}</a></p>
+                    <p><strong>Posted:</strong> {row['job_posted_date']}</p>
+                </div>
+            """, unsafe_allow_html=True)
+
 # Recommendation Logic
 if submit_btn:
     if not resume:
         st.warning("⚠️ Please upload a resume.")
+    elif resume.size > resume_ingest.MAX_FILE_BYTES:
+        st.warning(f"⚠️ Resumes are limited to {resume_ingest.MAX_FILE_BYTES // (1024 * 1024)} MB.")
     else:
-        with st.spinner("🔍 Analyzing your inputs..."):
-            resume_text = extract_text_from_pdf(resume) if resume.name.endswith(".pdf") else extract_text_from_docx(resume)
-            parsed_resume = extract_resume_info(resume_text)
-
-            user_input_text = " ".join([
-                job_type, preferred_skills, experience_level, location,
-                career_objective, parsed_resume["skills"], parsed_resume["education"]
-            ]).lower()
-
-            user_vector = vectorizer.transform([user_input_text])
-            similarity_scores = cosine_similarity(user_vector, tfidf_matrix).flatten()
-
-            df['similarity_score'] = similarity_scores
-            df['has_link'] = df['apply_link'].notnull() & df['apply_link'].str.startswith("http")
-
-            top_matches = df[df['similarity_score'] > 0.2]
-
-            if remote_only:
-                top_matches = top_matches[top_matches['job_location'].str.contains("remote")]
-
-            top_matches = top_matches.sort_values(by=['has_link', 'similarity_score'], ascending=[False, False])
-
-            st.success(f"✅ Found {len(top_matches)} matching job(s).")
-
-            if top_matches.empty:
-                st.info("❌ No matching jobs found. Try different inputs.")
-            else:
-                for _, row in top_matches.iterrows():
-                    with st.expander(f"🔹 {row['job_title'].title()} at {row['company_name']}"):
-                        st.markdown(f"""
-                            <div class="job-card">
-                                <p><strong>Location:</strong> {row['job_location'].title()}</p>
-                                <p><strong>Skills:</strong> {row['required_skills']}</p>
-                                <p><strong>Description:</strong> {row['job_description'][:300]}...</p>
-                                <p><strong>Match Score:</strong> {row['similarity_score']:.2f}</p>
-                                <p><strong>Apply:</strong> <a href="{row['apply_link']}" target="_blank">{row['apply_link']}</a></p>
-                                <p><strong>Posted:</strong> {row['job_posted_date']}</p>
-                            </div>
-                        """, unsafe_allow_html=True)
+        resume_bytes = resume.getvalue()
+        st.session_state.active_query = {
+            "resume_digest": hashlib.sha256(resume_bytes).hexdigest(),
+            "_resume_bytes": resume_bytes,
+            "resume_name": resume.name,
+            "preferences": (job_type, preferred_skills, experience_level, location, career_objective),
+            "semantic_mode": semantic_mode,
+            "posted_within": posted_within,
+        }
+        st.session_state.results_page = 1
+
+# Page flips rerun the script without a submit; the last query stays active
+if "active_query" in st.session_state:
+    with st.spinner("🔍 Analyzing your inputs..."):
+        # Posting-age filters are relative to now: such rankings are reused for the current hour only
+        posted_as_of = None
+        if st.session_state.active_query["posted_within"] in POSTED_BUCKETS:
+            posted_as_of = datetime.now().strftime("%Y-%m-%d %H")
+        doc_ids, scores = rank_query(
+            **st.session_state.active_query, store_version=store_version, index_version=vectorizer.version,
+            posted_as_of=posted_as_of
+        )
+    if remote_only:
+        keep = facets.remote[doc_ids]
+        doc_ids, scores = doc_ids[keep], scores[keep]
+    _, unknown_cities, _ = facets.parse_locations(st.session_state.active_query["preferences"][3])
+    if unknown_cities:
+        st.caption(f"No listings in {', '.join(unknown_cities)}; that location was not used as a filter.")
+    render_results(doc_ids, scores)
 
 st.markdown(f"<hr><p><strong>🗂️ Total Jobs in Database:</strong> {len(df)}</p>", unsafe_allow_html=True)
+
+# Opt-in sampling profile of this rerun (?profile=1)
+if profiler:
+    st.caption(f"Profile written to {profiler.stop()}")
@@ -0,0 +1,100 @@
+import os
+import time
+import threading
+import httpx
+import openai
+import perf
+
+# Backends selectable with ASCENDX_LLM_BACKEND; "local" is fake_llm_server.py
+LLM_BACKENDS = {
+    "remote": "https://api.chatanywhere.tech/v1",
+    "local": "http://127.0.0.1:8008/v1",
+}
+
+# Shared LLM client settings (override through the environment)
+LLM_BACKEND = os.environ.get("ASCENDX_LLM_BACKEND", "remote")
+LLM_BASE_URL = os.environ.get("ASCENDX_LLM_BASE_URL", LLM_BACKENDS[LLM_BACKEND])
+# Required for the remote backend; the local fake server accepts any key
+LLM_API_KEY = os.environ.get("ASCENDX_LLM_API_KEY", "")
+LLM_TIMEOUT = float(os.environ.get("ASCENDX_LLM_TIMEOUT", "60"))
+LLM_CONNECT_TIMEOUT = float(os.environ.get("ASCENDX_LLM_CONNECT_TIMEOUT", "5"))
+# The OpenAI SDK retries connection errors, 429s and 5xx with exponential backoff
+LLM_MAX_RETRIES = int(os.environ.get("ASCENDX_LLM_MAX_RETRIES", "3"))
+LLM_MAX_CONNECTIONS = int(os.environ.get("ASCENDX_LLM_MAX_CONNECTIONS", "50"))
+
+_lock = threading.Lock()
+_client = None
+_async_client = None
+
+
+def _client_options():
+    if not LLM_API_KEY and LLM_BACKEND != "local":
+        raise RuntimeError(f"ASCENDX_LLM_API_KEY is not set (needed for the {LLM_BACKEND} LLM backend)")
+    return dict(
+        api_key=LLM_API_KEY or "local",
+        base_url=LLM_BASE_URL,
+        timeout=httpx.Timeout(LLM_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+        max_retries=LLM_MAX_RETRIES,
+    )
+
+
+def _limits():
+    return httpx.Limits(max_connections=LLM_MAX_CONNECTIONS, max_keepalive_connections=LLM_MAX_CONNECTIONS)
+
+
+def get_client():
+    # One pooled keep-alive client per process, shared by every session
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = openai.OpenAI(http_client=httpx.Client(limits=_limits()), **_client_options())
+    return _client
+
+
+def get_async_client():
+    # Connections are bound to the event loop that first uses this client
+    global _async_client
+    if _async_client is None:
+        with _lock:
+            if _async_client is None:
+                _async_client = openai.AsyncOpenAI(http_client=httpx.AsyncClient(limits=_limits()), **_client_options())
+    return _async_client
+
+
+# --- Blocking interface ---
+def complete(messages, model="gpt-3.5-turbo", **params):
+    with perf.stage("llm_call", model=model):
+        response = get_client().chat.completions.create(model=model, messages=messages, **params)
+    return response.choices[0].message.content
+
+
+def stream(messages, model="gpt-3.5-turbo", **params):
+    # The request is sent (and retried) here; the returned generator yields text deltas.
+    # Time to first token and total time are measured from the request.
+    start = time.perf_counter()
+    response = get_client().chat.completions.create(model=model, messages=messages, stream=True, **params)
+    return perf.timed_stream(_iter_deltas(response), start=start, model=model)
+
+
+def _iter_deltas(response):
+    with response:
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+# --- Async interface ---
+async def acomplete(messages, model="gpt-3.5-turbo", **params):
+    response = await get_async_client().chat.completions.create(model=model, messages=messages, **params)
+    return response.choices[0].message.content
+
+
+async def astream(messages, model="gpt-3.5-turbo", **params):
+    response = await get_async_client().chat.completions.create(
+        model=model, messages=messages, stream=True, **params
+    )
+    async with response:
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
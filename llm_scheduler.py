@@ -0,0 +1,256 @@
+import os
+import json
+import math
+import time
+import hashlib
+import email.utils
+import threading
+import itertools
+from datetime import datetime, timezone
+import openai
+import llm_client
+
+# Scheduler settings (override through the environment)
+LLM_CONCURRENCY = int(os.environ.get("ASCENDX_LLM_CONCURRENCY", "8"))
+LLM_RATE = float(os.environ.get("ASCENDX_LLM_RATE", "5"))  # requests per second, sustained
+LLM_BURST = int(os.environ.get("ASCENDX_LLM_BURST", "10"))
+LLM_MAX_QUEUE = int(os.environ.get("ASCENDX_LLM_MAX_QUEUE", "200"))
+# Upstream 429s that outlast the SDK's own retries are requeued this many times
+RATE_LIMIT_REQUEUES = 3
+WAIT_POLL = 0.5
+
+# Lower runs first
+CHAT = 0
+ROADMAP = 1
+BACKGROUND = 2
+
+
+class SchedulerBusy(Exception):
+    # Raised instead of queueing when the wait list is full
+    pass
+
+
+def request_key(model, messages, params):
+    payload = json.dumps([model, messages, sorted(params.items())], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def retry_delay(retry_after, attempt):
+    # Retry-After is delay-seconds or an HTTP-date (RFC 9110); anything
+    # unparseable falls back to exponential backoff
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+            if math.isfinite(seconds):
+                return max(0.0, seconds)
+        except ValueError:
+            try:
+                when = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                when = None
+            if when is not None:
+                if when.tzinfo is None:
+                    when = when.replace(tzinfo=timezone.utc)
+                return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    return 2.0 ** attempt
+
+
+class Ticket:
+    def __init__(self, priority, seq):
+        self.priority = priority
+        self.seq = seq
+        self.admitted = threading.Event()
+
+    def order(self):
+        return self.priority, self.seq
+
+
+# One upstream call fanned out to every caller that asked for the same request.
+# A pump thread appends chunks; each reader replays them from the start.
+class SharedStream:
+    def __init__(self, scheduler, ticket):
+        self.scheduler = scheduler
+        self.ticket = ticket
+        self.chunks = []
+        self.done = False
+        self.error = None
+        self._cond = threading.Condition()
+
+    def _append(self, chunk):
+        with self._cond:
+            self.chunks.append(chunk)
+            self._cond.notify_all()
+
+    def _finish(self, error=None):
+        with self._cond:
+            self.done, self.error = True, error
+            self._cond.notify_all()
+
+    def __iter__(self):
+        return self.iter()
+
+    def iter(self, on_wait=None):
+        # on_wait(position) is called while the request is still queued
+        sent = 0
+        while True:
+            with self._cond:
+                if sent == len(self.chunks) and not self.done:
+                    self._cond.wait(WAIT_POLL)
+                pending = self.chunks[sent:]
+                done, error = self.done, self.error
+            if pending:
+                sent += len(pending)
+                yield from pending
+            elif done:
+                if error is not None:
+                    raise error
+                return
+            elif on_wait is not None and not self.ticket.admitted.is_set():
+                on_wait(self.scheduler.position(self.ticket))
+
+
+# Process-wide gate in front of the LLM endpoint: at most max_concurrency calls
+# in flight, admissions paced by a token bucket, queued callers served by
+# priority (chat before roadmaps before background work), and identical
+# in-flight requests coalesced into one upstream call. No dispatcher thread:
+# whoever changes the state (enqueue, release, a waiting pump) admits the
+# next tickets.
+class LLMScheduler:
+    def __init__(self, max_concurrency=LLM_CONCURRENCY, rate=LLM_RATE, burst=LLM_BURST, max_queue=LLM_MAX_QUEUE):
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.burst = burst
+        self.max_queue = max_queue
+        self._cond = threading.Condition()
+        self._queue = []
+        self._running = 0
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+        self._seq = itertools.count()
+        self._inflight = {}
+        self.stats = {"requests": 0, "coalesced": 0, "rejected": 0, "rate_limited": 0}
+
+    # --- Admission ---
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def _admit(self):
+        # Caller holds self._cond; returns seconds until the next token if one is missing
+        now = time.monotonic()
+        self._refill(now)
+        while self._queue and self._running < self.max_concurrency:
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            ticket = min(self._queue, key=Ticket.order)
+            self._queue.remove(ticket)
+            self._tokens -= 1
+            self._running += 1
+            ticket.admitted.set()
+            self._cond.notify_all()
+        return None
+
+    def _enqueue(self, ticket):
+        with self._cond:
+            self._queue.append(ticket)
+            self._admit()
+
+    def _wait_admitted(self, ticket):
+        with self._cond:
+            while not ticket.admitted.is_set():
+                delay = self._admit()
+                if not ticket.admitted.is_set():
+                    self._cond.wait(min(delay or WAIT_POLL, WAIT_POLL))
+
+    def _release(self):
+        with self._cond:
+            self._running -= 1
+            self._admit()
+            self._cond.notify_all()
+
+    def _pause(self, seconds):
+        # Provider said slow down: hold every admission, not just this request's
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self.stats["rate_limited"] += 1
+
+    def position(self, ticket):
+        # 1-based place in line; 0 once admitted
+        with self._cond:
+            if ticket.admitted.is_set():
+                return 0
+            return 1 + sum(1 for other in self._queue if other.order() < ticket.order())
+
+    def queue_length(self):
+        with self._cond:
+            return len(self._queue)
+
+    # --- Requests ---
+    def stream(self, messages, model="gpt-3.5-turbo", priority=CHAT, key=None, **params):
+        # Returns a SharedStream; iterate it (or .iter(on_wait)) for text deltas
+        key = key or request_key(model, messages, params)
+        with self._cond:
+            shared = self._inflight.get(key)
+            if shared is not None:
+                self.stats["coalesced"] += 1
+                if priority < shared.ticket.priority and not shared.ticket.admitted.is_set():
+                    shared.ticket.priority = priority
+                return shared
+            if len(self._queue) >= self.max_queue:
+                self.stats["rejected"] += 1
+                raise SchedulerBusy(f"{len(self._queue)} requests already waiting")
+            shared = SharedStream(self, Ticket(priority, next(self._seq)))
+            self._inflight[key] = shared
+            self.stats["requests"] += 1
+            # Queued here, not in the pump, so the position is known right away
+            self._queue.append(shared.ticket)
+            self._admit()
+        threading.Thread(target=self._pump, args=(key, shared, messages, model, params), daemon=True).start()
+        return shared
+
+    def complete(self, messages, model="gpt-3.5-turbo", priority=BACKGROUND, key=None, **params):
+        return "".join(self.stream(messages, model, priority, key, **params))
+
+    def _pump(self, key, shared, messages, model, params):
+        ticket = shared.ticket
+        error = None
+        try:
+            for attempt in range(RATE_LIMIT_REQUEUES + 1):
+                if attempt:
+                    self._enqueue(ticket)
+                self._wait_admitted(ticket)
+                try:
+                    for chunk in llm_client.stream(messages, model=model, **params):
+                        shared._append(chunk)
+                    break
+                except openai.RateLimitError as e:
+                    if shared.chunks or attempt == RATE_LIMIT_REQUEUES:
+                        raise
+                    retry_after = e.response.headers.get("retry-after") if e.response is not None else None
+                    self._pause(retry_delay(retry_after, attempt))
+                    ticket.admitted.clear()
+                finally:
+                    self._release()
+        except Exception as e:
+            error = e
+        finally:
+            with self._cond:
+                self._inflight.pop(key, None)
+            shared._finish(error)
+
+
+_scheduler = None
+_lock = threading.Lock()
+
+
+def get_scheduler():
+    # One scheduler per process, shared by every page and session
+    global _scheduler
+    if _scheduler is None:
+        with _lock:
+            if _scheduler is None:
+                _scheduler = LLMScheduler()
+    return _scheduler
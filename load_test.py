@@ -0,0 +1,210 @@
+import os
+import sys
+import json
+import time
+import random
+import socket
+import threading
+import argparse
+import subprocess
+from urllib.parse import urlsplit
+
+CHAT_SYSTEM_PROMPT = (
+    "You are an empathetic career guidance coach who helps users navigate emotional career "
+    "struggles with warmth, encouragement, and practical advice."
+)
+
+CHAT_MESSAGES = [
+    "I'm feeling stuck in my career.",
+    "I got rejected from three interviews this month.",
+    "How do I move from support into data analysis?",
+    "Is it worth doing a certification in cloud?",
+    "What should I focus on for the next few weeks?",
+]
+
+# A few transitions make up most roadmap traffic
+ROADMAP_TRANSITIONS = [
+    (("Intern", "Data Analyst", "6 months"), 0.4),
+    (("Marketing Intern", "Data Analyst", "6 months"), 0.2),
+    (("Software Developer", "Data Scientist", "1 year"), 0.2),
+    (("Support Engineer", "Cloud Engineer", "9 months"), 0.1),
+    (("Student", "Web Developer", "3 months"), 0.1),
+]
+
+
+def wait_for_server(url, process=None, timeout=10.0):
+    # Polls until the server behind url accepts connections (or its process exits)
+    parts = urlsplit(url)
+    address = (parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection(address, timeout=0.5):
+                return
+        except OSError:
+            if process is not None and process.poll() is not None:
+                raise SystemExit(f"Fake LLM server exited with status {process.returncode}")
+            if time.monotonic() > deadline:
+                raise SystemExit(f"Fake LLM server did not start listening on {address[0]}:{address[1]}")
+            time.sleep(0.05)
+
+
+def percentile(values, pct):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def timed_stream(kind, messages, model, results, priority, key=None, **params):
+    # Every request goes through the shared scheduler, as the app's pages do
+    import llm_scheduler
+
+    start = time.perf_counter()
+    ttft = None
+    chunks = []
+    try:
+        for delta in llm_scheduler.get_scheduler().stream(messages, model=model, priority=priority, key=key, **params):
+            if ttft is None:
+                ttft = time.perf_counter() - start
+            chunks.append(delta)
+    except Exception as e:  # SchedulerBusy included: a rejected request counts as an error
+        results.append({"kind": kind, "latency": time.perf_counter() - start, "ttft": ttft,
+                        "chunks": len(chunks), "error": type(e).__name__})
+        return None
+    results.append({"kind": kind, "latency": time.perf_counter() - start, "ttft": ttft,
+                    "chunks": len(chunks), "error": None})
+    return "".join(chunks)
+
+
+def chat_session(turns, think_time, results):
+    import llm_scheduler
+    from chat_context import ConversationContext
+
+    history = [{"role": "system", "content": CHAT_SYSTEM_PROMPT}]
+    # Summaries are not generated here so every request measured is a chat turn
+    context = ConversationContext(summarizer=lambda summary, messages: summary)
+    for _ in range(turns):
+        history.append({"role": "user", "content": random.choice(CHAT_MESSAGES)})
+        reply = timed_stream("chat", context.build(history), "gpt-4", results, llm_scheduler.CHAT,
+                             max_tokens=150, temperature=0.7)
+        history.append({"role": "assistant", "content": reply or ""})
+        time.sleep(random.uniform(0, think_time))
+
+
+def roadmap_user(requests, think_time, results, cache=None):
+    import llm_scheduler
+    from roadmap_cache import roadmap_key, roadmap_prompt
+
+    transitions, weights = zip(*ROADMAP_TRANSITIONS)
+    for _ in range(requests):
+        inputs = random.choices(transitions, weights)[0]
+        key = roadmap_key(*inputs)
+        if cache is not None:
+            start = time.perf_counter()
+            if cache.get(key) is not None:
+                elapsed = time.perf_counter() - start
+                results.append({"kind": "roadmap", "latency": elapsed, "ttft": elapsed,
+                                "chunks": 0, "error": None, "cached": True})
+                time.sleep(random.uniform(0, think_time))
+                continue
+        # Keyed like quro.py, so identical in-flight roadmaps are coalesced
+        roadmap = timed_stream("roadmap", [{"role": "user", "content": roadmap_prompt(*inputs)}],
+                               "gpt-3.5-turbo", results, llm_scheduler.ROADMAP, key=key)
+        if cache is not None and roadmap:
+            cache.put(key, roadmap)
+        time.sleep(random.uniform(0, think_time))
+
+
+def summarize_results(results, wall_time):
+    report = {"wall_time_s": wall_time}
+    for kind in sorted({r["kind"] for r in results}):
+        rows = [r for r in results if r["kind"] == kind]
+        ok = [r for r in rows if r["error"] is None]
+        latencies = [r["latency"] for r in ok]
+        ttfts = [r["ttft"] for r in ok if r["ttft"] is not None]
+        report[kind] = {
+            "requests": len(rows),
+            "errors": len(rows) - len(ok),
+            "cached": sum(1 for r in ok if r.get("cached")),
+            "throughput_rps": len(ok) / wall_time if wall_time else 0.0,
+            "chunks_per_s": sum(r["chunks"] for r in ok) / wall_time if wall_time else 0.0,
+            **{f"latency_p{p}_s": percentile(latencies, p) for p in (50, 95, 99)},
+            **{f"ttft_p{p}_s": percentile(ttfts, p) for p in (50, 95, 99)},
+        }
+    return report
+
+
+def run(args):
+    import llm_scheduler
+
+    cache = None
+    if args.roadmap_cache:
+        from roadmap_cache import RoadmapCache
+        cache = RoadmapCache(path=args.roadmap_cache)
+
+    # One thread per simulated user, as Streamlit runs one script thread per session
+    results = []
+    users = [(chat_session, (args.chat_turns, args.think_time, results)) for _ in range(args.chat_sessions)]
+    users += [(roadmap_user, (args.roadmap_requests, args.think_time, results, cache))
+              for _ in range(args.roadmap_users)]
+    threads = [threading.Thread(target=target, args=user_args, daemon=True) for target, user_args in users]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    report = summarize_results(results, time.perf_counter() - start)
+    report["scheduler"] = dict(llm_scheduler.get_scheduler().stats)
+    return report
+
+
+def print_report(report):
+    print(f"Wall time: {report['wall_time_s']:.2f}s")
+    for kind, stats in report.items():
+        if kind in ("wall_time_s", "scheduler"):
+            continue
+        print(f"\n[{kind}] {stats['requests']} requests, {stats['errors']} errors, {stats['cached']} cached, "
+              f"{stats['throughput_rps']:.2f} req/s, {stats['chunks_per_s']:.1f} tokens/s")
+        print("  latency  p50 {latency_p50_s:.3f}s  p95 {latency_p95_s:.3f}s  p99 {latency_p99_s:.3f}s".format(**stats))
+        print("  ttft     p50 {ttft_p50_s:.3f}s  p95 {ttft_p95_s:.3f}s  p99 {ttft_p99_s:.3f}s".format(**stats))
+    if "scheduler" in report:
+        print("\n[scheduler] {requests} upstream requests, {coalesced} coalesced, {rejected} rejected, "
+              "{rate_limited} rate limited".format(**report["scheduler"]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate concurrent chat sessions and roadmap requests")
+    parser.add_argument("--backend", default="local", help="Value for ASCENDX_LLM_BACKEND")
+    parser.add_argument("--chat-sessions", type=int, default=20)
+    parser.add_argument("--chat-turns", type=int, default=5)
+    parser.add_argument("--roadmap-users", type=int, default=10)
+    parser.add_argument("--roadmap-requests", type=int, default=5)
+    parser.add_argument("--think-time", type=float, default=0.5, help="Max seconds between a user's requests")
+    parser.add_argument("--roadmap-cache", default=None, help="Route roadmaps through a RoadmapCache at this path")
+    parser.add_argument("--spawn-fake", action="store_true", help="Start fake_llm_server.py for the run")
+    parser.add_argument("--fake-args", default="", help="Extra arguments for the spawned fake server")
+    parser.add_argument("--json", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    # llm_client reads its settings on import, so the backend is set first
+    os.environ["ASCENDX_LLM_BACKEND"] = args.backend
+
+    server = None
+    try:
+        if args.spawn_fake:
+            import llm_client
+            server_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_llm_server.py")
+            server = subprocess.Popen([sys.executable, server_script, *args.fake_args.split()])
+            wait_for_server(llm_client.LLM_BASE_URL, server)
+        report = run(args)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
@@ -0,0 +1,240 @@
+import os
+import sys
+import json
+import time
+import logging
+import threading
+import contextlib
+from logging.handlers import RotatingFileHandler
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import psutil
+except ImportError:  # optional: falls back to /proc on Linux
+    psutil = None
+
+# Structured stage records, one JSON object per line ("" disables). The log is
+# rotated at PERF_LOG_MAX_BYTES, keeping PERF_LOG_BACKUPS older files
+# (each process rotates on its own view of the size).
+PERF_LOG = os.environ.get("ASCENDX_PERF_LOG", "perf_log.jsonl")
+PERF_LOG_MAX_BYTES = int(os.environ.get("ASCENDX_PERF_LOG_MAX_BYTES", str(20 * 1024 * 1024)))
+PERF_LOG_BACKUPS = 3
+# Prometheus text exposition, rewritten by processes that called configure()
+METRICS_PATH = os.environ.get("ASCENDX_PERF_METRICS", "perf_metrics.prom")
+METRICS_PORT = int(os.environ.get("ASCENDX_METRICS_PORT", "0"))
+METRICS_WRITE_INTERVAL = 5.0
+PROFILE_DIR = os.environ.get("ASCENDX_PROFILE_DIR", "perf_profiles")
+PROFILE_INTERVAL = 0.005
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_app = os.path.splitext(os.path.basename(sys.argv[0]))[0] or "python"
+# Pages of the multipage app share a process; each script thread labels its own records
+_context = threading.local()
+_exporting = False
+_lock = threading.Lock()
+_histograms = defaultdict(lambda: [0] * (len(BUCKETS) + 1))
+_sums = Counter()
+_rss = Counter()
+_last_write = 0.0
+_log_handler = None
+
+
+def rss_bytes():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def configure(app, metrics_path=METRICS_PATH, metrics_port=METRICS_PORT):
+    # Called by each app on every rerun; worker processes only write the JSON log
+    global _app, _exporting, METRICS_PATH
+    _context.app = app
+    with _lock:
+        _app, METRICS_PATH = app, metrics_path
+        if not _exporting and metrics_port:
+            serve_metrics(metrics_port)
+        _exporting = True
+
+
+def _log(line):
+    # Caller holds _lock
+    global _log_handler
+    path = os.path.abspath(PERF_LOG)
+    if _log_handler is None or _log_handler.baseFilename != path:
+        if _log_handler is not None:
+            _log_handler.close()
+        _log_handler = RotatingFileHandler(
+            path, maxBytes=PERF_LOG_MAX_BYTES, backupCount=PERF_LOG_BACKUPS, encoding="utf-8", delay=True
+        )
+    _log_handler.emit(logging.makeLogRecord({"msg": line}))
+
+
+def record(stage, seconds, process_rss_delta=None, **labels):
+    # process_rss_delta is the RSS change of the whole process over the stage,
+    # so it includes allocations by any session running at the same time
+    global _last_write
+    app = getattr(_context, "app", _app)
+    entry = {"ts": time.time(), "app": app, "pid": os.getpid(), "stage": stage,
+             "seconds": round(seconds, 6), "process_rss_delta": process_rss_delta, **labels}
+    if PERF_LOG:
+        line = json.dumps(entry, default=str)
+        with _lock:
+            _log(line)
+
+    key = (app, stage)
+    with _lock:
+        counts = _histograms[key]
+        counts[next((i for i, bound in enumerate(BUCKETS) if seconds <= bound), len(BUCKETS))] += 1
+        _sums[key] += seconds
+        if process_rss_delta is not None:
+            _rss[key] += process_rss_delta
+        due = _exporting and METRICS_PATH and time.time() - _last_write >= METRICS_WRITE_INTERVAL
+        if due:
+            _last_write = time.time()
+    if due:
+        write_metrics()
+
+
+@contextlib.contextmanager
+def stage(name, **labels):
+    # with perf.stage("csv_load", rows=...): times the block and the process RSS delta over it
+    rss_before = rss_bytes()
+    start = time.perf_counter()
+    try:
+        yield labels
+    finally:
+        elapsed = time.perf_counter() - start
+        rss_after = rss_bytes()
+        delta = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+        record(name, elapsed, delta, **labels)
+
+
+def timed_stream(chunks, name="llm_call", start=None, **labels):
+    # Wraps a streaming response: records time to first chunk as "<name>_ttft"
+    # and the full duration as name once the stream is exhausted or closed.
+    # start defaults to the first next() call; pass the request time instead.
+    start = start if start is not None else time.perf_counter()
+    first = True
+    try:
+        for chunk in chunks:
+            if first:
+                record(f"{name}_ttft", time.perf_counter() - start, **labels)
+                first = False
+            yield chunk
+    finally:
+        record(name, time.perf_counter() - start, **labels)
+
+
+def render_metrics():
+    with _lock:
+        keys = sorted(_histograms)
+        snapshot = [(key, list(_histograms[key]), _sums[key], _rss[key]) for key in keys]
+    lines = [
+        "# HELP ascendx_stage_seconds Duration of instrumented stages.",
+        "# TYPE ascendx_stage_seconds histogram",
+    ]
+    for (app, name), counts, total, _ in snapshot:
+        labels = f'app="{app}",stage="{name}"'
+        cumulative = 0
+        for bound, count in zip(BUCKETS, counts):
+            cumulative += count
+            lines.append(f'ascendx_stage_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+        cumulative += counts[-1]
+        lines.append(f'ascendx_stage_seconds_bucket{{{labels},le="+Inf"}} {cumulative}')
+        lines.append(f"ascendx_stage_seconds_sum{{{labels}}} {total}")
+        lines.append(f"ascendx_stage_seconds_count{{{labels}}} {cumulative}")
+    lines += [
+        "# HELP ascendx_stage_process_rss_delta_bytes Summed whole-process RSS change during instrumented "
+        "stages (includes concurrent sessions).",
+        "# TYPE ascendx_stage_process_rss_delta_bytes gauge",
+    ]
+    for (app, name), _, _, rss in snapshot:
+        lines.append(f'ascendx_stage_process_rss_delta_bytes{{app="{app}",stage="{name}"}} {rss}')
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(path=None):
+    # Atomic rewrite, suitable for a node_exporter textfile collector
+    path = path or METRICS_PATH
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "w") as f:
+        f.write(render_metrics())
+    os.replace(tmp, path)
+
+
+def serve_metrics(port, host="0.0.0.0"):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = render_metrics().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# --- Opt-in sampling profiler ---
+def profiling_requested(query_params=None):
+    # ASCENDX_PROFILE=1 profiles every rerun; ?profile=1 profiles a single one
+    if os.environ.get("ASCENDX_PROFILE") == "1":
+        return True
+    return query_params is not None and query_params.get("profile") == "1"
+
+
+# Samples one thread's stack every PROFILE_INTERVAL seconds and writes the
+# counts as collapsed stacks (flamegraph.pl / speedscope input). It stops on
+# stop() or after max_seconds, so a rerun cut short by st.stop() still ends.
+class SamplingProfiler:
+    def __init__(self, name, thread_id=None, interval=PROFILE_INTERVAL, max_seconds=120):
+        self.name = name
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.stacks = Counter()
+        self.path = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        deadline = time.monotonic() + self.max_seconds
+        while not self._stop.wait(self.interval) and time.monotonic() < deadline:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                break
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+        self._write()
+
+    def _write(self):
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_DIR, f"{self.name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.folded")
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        self.path = path
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        return self.path
+
+
+def start_profiler(name, enabled):
+    return SamplingProfiler(name) if enabled else None
@@ -0,0 +1,150 @@
+import os
+import json
+import random
+import sqlite3
+import argparse
+import threading
+import contextlib
+
+BANK_PATH = os.environ.get("ASCENDX_QUESTION_BANK", "question_bank.sqlite3")
+# Bundled questions, imported automatically into an empty bank
+SEED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "question_bank.json")
+
+
+def read_questions(path):
+    # .json: {"Role": [{"question", "options", "answer"}, ...]}
+    # .jsonl: one {"role", "question", "options", "answer"} object per line
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    item = json.loads(line)
+                    yield item["role"], item
+        else:
+            for role, items in json.load(f).items():
+                for item in items:
+                    yield role, item
+
+
+def validate(role, item):
+    options = item.get("options") or []
+    answer = item.get("answer")
+    if not role or not item.get("question"):
+        raise ValueError(f"Question without role or text: {item!r}")
+    if len(options) < 2 or len(set(options)) != len(options):
+        raise ValueError(f"Need at least two distinct options: {item['question']!r}")
+    if not isinstance(answer, int) or not 0 <= answer < len(options):
+        raise ValueError(f"Answer index out of range: {item['question']!r}")
+    return role.strip(), item["question"].strip(), json.dumps(options, ensure_ascii=False), answer
+
+
+# Questions live in one SQLite table indexed by role. Roles are read lazily:
+# the first quiz for a role loads its questions once per process, and later
+# samples only draw indices from that cached tuple. Every import bumps a
+# generation counter, so imports from other processes (the CLI) drop the
+# cached roles on their next access.
+class QuestionBank:
+    def __init__(self, path=BANK_PATH, seed_path=SEED_PATH):
+        self.path = path
+        self._roles = None
+        self._loaded = {}
+        self._generation = None
+        self._lock = threading.Lock()
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS questions ("
+                "id INTEGER PRIMARY KEY, role TEXT NOT NULL, question TEXT NOT NULL, "
+                "options TEXT NOT NULL, answer INTEGER NOT NULL, UNIQUE (role, question))"
+            )
+            db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            db.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0)")
+            empty = db.execute("SELECT 1 FROM questions LIMIT 1").fetchone() is None
+        if empty and seed_path and os.path.exists(seed_path):
+            self.import_questions(read_questions(seed_path))
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # One short-lived connection per operation: committed, then closed
+        db = sqlite3.connect(self.path, timeout=5)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _check_generation(self, db):
+        # Caller holds self._lock; drops cached questions after any import
+        generation = db.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()[0]
+        if generation != self._generation:
+            self._roles = None
+            self._loaded.clear()
+            self._generation = generation
+
+    def import_questions(self, items, replace_roles=False):
+        # items: iterable of (role, question dict); existing (role, question) pairs are updated
+        rows = [validate(role, item) for role, item in items]
+        with self._connect() as db:
+            if replace_roles:
+                db.executemany("DELETE FROM questions WHERE role = ?", [(role,) for role in {r[0] for r in rows}])
+            db.executemany(
+                "INSERT INTO questions (role, question, options, answer) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (role, question) DO UPDATE SET options = excluded.options, answer = excluded.answer",
+                rows
+            )
+            db.execute("UPDATE meta SET value = value + 1 WHERE key = 'generation'")
+        return len(rows)
+
+    def roles(self):
+        with self._lock, self._connect() as db:
+            self._check_generation(db)
+            if self._roles is None:
+                rows = db.execute("SELECT role FROM questions GROUP BY role ORDER BY MIN(id)")
+                self._roles = [role for (role,) in rows]
+            return self._roles
+
+    def load_role(self, role):
+        with self._lock, self._connect() as db:
+            self._check_generation(db)
+            questions = self._loaded.get(role)
+            if questions is None:
+                rows = db.execute(
+                    "SELECT id, question, options, answer FROM questions WHERE role = ? ORDER BY id", (role,)
+                ).fetchall()
+                questions = tuple(
+                    {"id": qid, "question": text, "options": json.loads(options), "answer": answer}
+                    for qid, text, options, answer in rows
+                )
+                self._loaded[role] = questions
+            return questions
+
+    def sample(self, role, n, rng=random):
+        questions = self.load_role(role)
+        return [questions[i] for i in rng.sample(range(len(questions)), min(n, len(questions)))]
+
+    def counts(self):
+        with self._connect() as db:
+            return dict(db.execute("SELECT role, COUNT(*) FROM questions GROUP BY role ORDER BY role"))
+
+    def export(self, path):
+        bank = {role: [{k: q[k] for k in ("question", "options", "answer")} for q in self.load_role(role)]
+                for role in self.roles()}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(bank, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the quiz question bank")
+    parser.add_argument("command", choices=["import", "export", "stats"])
+    parser.add_argument("files", nargs="*", help="JSON/JSONL files to import, or the export target")
+    parser.add_argument("--bank", default=BANK_PATH)
+    parser.add_argument("--replace", action="store_true", help="Replace all questions of the imported roles")
+    args = parser.parse_args()
+
+    bank = QuestionBank(args.bank)
+    if args.command == "import":
+        for path in args.files:
+            print(f"Imported {bank.import_questions(read_questions(path), args.replace)} questions from {path}")
+    elif args.command == "export":
+        bank.export(args.files[0] if args.files else "question_bank_export.json")
+    for role, count in bank.counts().items():
+        print(f"{role}: {count}")
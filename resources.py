@@ -0,0 +1,145 @@
+import os
+import copy
+import threading
+import perf
+
+# Resources loaded by the warm-up hook, comma-separated (empty disables)
+WARMUP = os.environ.get("ASCENDX_WARMUP", "")
+RESUME_WORKERS = int(os.environ.get("ASCENDX_RESUME_WORKERS", "2"))
+
+_factories = {}
+_instances = {}
+_locks = {}
+_lock = threading.Lock()
+
+
+# Process-wide registry of shared, read-only resources. Every page of the app
+# gets the same instance, and heavy modules are only imported by the factory,
+# on first use. A resource is keyed by optional version arguments; asking for
+# a new version replaces the old instance.
+def register(name):
+    def decorator(factory):
+        _factories[name] = factory
+        return factory
+    return decorator
+
+
+def get(name, *version):
+    with _lock:
+        lock = _locks.setdefault(name, threading.Lock())
+    # One lock per resource: a slow load never blocks the others
+    with lock:
+        entry = _instances.get(name)
+        if entry is None or entry[0] != version:
+            with perf.stage("resource_load", resource=name):
+                entry = (version, _factories[name](*version))
+            _instances[name] = entry
+        return entry[1]
+
+
+def loaded():
+    with _lock:
+        return {name: version for name, (version, _) in _instances.items()}
+
+
+def warm_up(names=None, background=True):
+    # Loads resources ahead of the first visitor; names default to ASCENDX_WARMUP
+    names = [name.strip() for name in (names or WARMUP.split(",")) if name.strip()]
+
+    def run():
+        for name in names:
+            try:
+                get(name, *_current_version(name))
+            except Exception as e:
+                perf.record("resource_warmup_failed", 0.0, resource=name, error=repr(e))
+
+    if background:
+        threading.Thread(target=run, daemon=True).start()
+    else:
+        run()
+
+
+def _current_version(name):
+    if name in ("job_corpus", "tfidf_index"):
+        import job_store
+        store_version = job_store.store_version()
+        if name == "tfidf_index":
+            return store_version, snapshot_version()
+        return (store_version,)
+    if name == "dash_table":
+        from dash_data import DATA_PATH
+        return DATA_PATH, os.path.getmtime(DATA_PATH)
+    return ()
+
+
+# --- Job corpus and TF-IDF index ---
+@register("job_corpus")
+def _job_corpus(store_version):
+    import job_store
+    with perf.stage("csv_load", source="job_store"):
+        return job_store.load_corpus()
+
+
+@register("index_watcher")
+def _index_watcher():
+    # Versioned TF-IDF snapshots, loaded in the background as they are published
+    import tfidf_index
+    watcher = tfidf_index.SnapshotWatcher()
+    watcher.loaded.wait(timeout=30)
+    return watcher
+
+
+def snapshot_version():
+    current = get("index_watcher").current
+    return current.version if current else 0
+
+
+@register("tfidf_index")
+def _tfidf_index(store_version, snapshot_version):
+    import tfidf_index
+    corpus = get("job_corpus", store_version)
+    texts, keys = corpus['combined_text'].tolist(), corpus['listing_key'].tolist()
+    index = get("index_watcher").current
+    if index is None:
+        # No snapshot yet: build once and publish it for the other workers
+        with perf.stage("vectorizer_fit", docs=len(texts)):
+            index = tfidf_index.TfidfIndex.build(texts, keys)
+        index.save()
+        return index
+    # Listings ingested after the snapshot are appended, not refit; a snapshot
+    # of a different corpus (e.g. before a rebuild) is rebuilt
+    with perf.stage("vectorizer_fit", docs=len(texts) - index.n_docs, incremental=True):
+        return tfidf_index.sync_with_corpus(copy.copy(index), texts, keys)
+
+
+# --- Resume parsing ---
+@register("resume_pool")
+def _resume_pool():
+    # Workers load spaCy when they start, not on the first upload
+    from concurrent.futures import ProcessPoolExecutor
+    import resume_ingest
+    pool = ProcessPoolExecutor(max_workers=RESUME_WORKERS, initializer=resume_ingest.load_parser)
+    for _ in range(RESUME_WORKERS):
+        pool.submit(int)  # start the workers now
+    return pool
+
+
+# --- Career toolkit ---
+@register("question_bank")
+def _question_bank():
+    from question_bank import QuestionBank
+    return QuestionBank()
+
+
+@register("roadmap_cache")
+def _roadmap_cache():
+    from roadmap_cache import RoadmapCache
+    return RoadmapCache()
+
+
+# --- Dashboard ---
+@register("dash_table")
+def _dash_table(path, data_version):
+    from dash_data import load_job_table
+    with perf.stage("csv_load", path=os.path.basename(path)):
+        return load_job_table(path)
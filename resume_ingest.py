@@ -0,0 +1,194 @@
+import io
+import os
+import json
+import zipfile
+import hashlib
+import argparse
+import functools
+import importlib
+import perf
+from concurrent.futures import Future, ProcessPoolExecutor
+
+CACHE_DIR = os.environ.get("ASCENDX_RESUME_CACHE", "resume_cache")
+MAX_FILE_BYTES = 5 * 1024 * 1024
+RESUME_EXTENSIONS = (".pdf", ".docx")
+# Seconds an interactive upload may wait for a pool worker
+UPLOAD_TIMEOUT = float(os.environ.get("ASCENDX_UPLOAD_TIMEOUT", "60"))
+# Bump when extraction or parsing changes; cached parses from other versions are ignored
+PARSER_VERSION = 1
+# The skills vocabulary resume_parser matches against (same setting it reads)
+SKILLS_FILE = os.environ.get(
+    "ASCENDX_SKILLS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills.txt")
+)
+
+
+# --- Content-hash cache ---
+# Extracted text and parsed fields are stored under the SHA-256 of the file
+# bytes and the parser version, so a re-upload or a re-run campaign never
+# parses the same file twice, and a parser or skills.txt change re-parses.
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+@functools.lru_cache(maxsize=8)
+def _vocabulary_digest(path, mtime_ns):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def parser_version(skills_file=None):
+    skills_file = skills_file or SKILLS_FILE
+    return f"{PARSER_VERSION}-{_vocabulary_digest(skills_file, os.stat(skills_file).st_mtime_ns)}"
+
+
+def cache_key(data):
+    return hashlib.sha256(parser_version().encode("utf-8") + b"\0" + data).hexdigest()
+
+
+def _cache_path(key, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, key[:2], key + ".json")
+
+
+def cache_get(key, cache_dir=CACHE_DIR):
+    try:
+        with open(_cache_path(key, cache_dir), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(key, record, cache_dir=CACHE_DIR):
+    path = _cache_path(key, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(record, f)
+    os.replace(tmp_path, path)
+
+
+# --- Parsing ---
+def parse_bytes(data, name, cache_dir=CACHE_DIR):
+    key = cache_key(data)
+    cached = cache_get(key, cache_dir)
+    if cached is not None:
+        return dict(cached, name=name, cached=True)
+
+    # spaCy is only imported in the process that actually parses
+    from resume_parser import extract_text, extract_resume_info
+
+    with perf.stage("resume_extract", bytes=len(data)):
+        text = extract_text(io.BytesIO(data), name.lower())
+    with perf.stage("spacy_parse", chars=len(text)):
+        info = extract_resume_info(text)
+    record = {"hash": content_hash(data), "parser": parser_version(), "text": text, **info}
+    cache_put(key, record, cache_dir)
+    return dict(record, name=name, cached=False)
+
+
+def load_parser():
+    # Pool initializer: importing resume_parser loads the spaCy model and the
+    # skill matcher, so each worker pays for it once, before its first upload
+    importlib.import_module("resume_parser")
+
+
+def _parse_item(item):
+    name, loader = item
+    try:
+        data = loader()
+        if len(data) > MAX_FILE_BYTES:
+            return {"name": name, "error": f"file exceeds {MAX_FILE_BYTES} bytes"}
+        return parse_bytes(data, name)
+    except Exception as e:
+        return {"name": name, "error": str(e)}
+
+
+class _FileLoader:
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self):
+        with open(self.path, "rb") as f:
+            return f.read(MAX_FILE_BYTES + 1)
+
+
+class _ZipMemberLoader:
+    def __init__(self, archive, member):
+        self.archive = archive
+        self.member = member
+
+    def __call__(self):
+        with zipfile.ZipFile(self.archive) as zf, zf.open(self.member) as f:
+            return f.read(MAX_FILE_BYTES + 1)
+
+
+def iter_resume_sources(paths):
+    # Yields (name, loader) for every resume in the given files, directories and zip archives
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for file_name in sorted(files):
+                    full = os.path.join(root, file_name)
+                    if file_name.lower().endswith(RESUME_EXTENSIONS):
+                        yield full, _FileLoader(full)
+                    elif file_name.lower().endswith(".zip"):
+                        yield from iter_resume_sources([full])
+        elif path.lower().endswith(".zip"):
+            with zipfile.ZipFile(path) as zf:
+                for info in zf.infolist():
+                    if info.filename.lower().endswith(RESUME_EXTENSIONS) and not info.is_dir():
+                        yield f"{path}:{info.filename}", _ZipMemberLoader(path, info.filename)
+        elif path.lower().endswith(RESUME_EXTENSIONS):
+            yield path, _FileLoader(path)
+
+
+def ingest(paths, workers=None, chunksize=4):
+    # Records come back in input order; failures carry an "error" field
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_parse_item, iter_resume_sources(paths), chunksize=chunksize)
+
+
+def check_size(data):
+    if len(data) > MAX_FILE_BYTES:
+        raise ValueError(f"Resume is larger than {MAX_FILE_BYTES // (1024 * 1024)} MB")
+
+
+def submit_upload(data, name, pool):
+    # Starts parsing and returns a Future, so the session can do other work
+    # while a worker parses. Cache hits are served in the calling process.
+    check_size(data)
+    cached = cache_get(cache_key(data))
+    if cached is None:
+        return pool.submit(parse_bytes, data, name)
+    future = Future()
+    future.set_result(dict(cached, name=name, cached=True))
+    return future
+
+
+def parse_upload(data, name, pool=None, timeout=UPLOAD_TIMEOUT):
+    if pool is None:
+        check_size(data)
+        return parse_bytes(data, name)
+    return submit_upload(data, name, pool).result(timeout=timeout)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse directories or zip archives of resumes in bulk")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default=None, help="Write one JSON record per resume to this file")
+    args = parser.parse_args()
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else None
+    parsed = hits = failed = 0
+    for record in ingest(args.paths, workers=args.workers):
+        if "error" in record:
+            failed += 1
+            print(f"[Error] {record['name']}: {record['error']}")
+            continue
+        parsed += 1
+        hits += record["cached"]
+        if out:
+            out.write(json.dumps(record) + "\n")
+    if out:
+        out.close()
+    print(f"Parsed {parsed} resumes ({hits} from cache), {failed} failed")
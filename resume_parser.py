@@ -0,0 +1,102 @@
+import os
+import re
+import fitz  # PyMuPDF
+import docx
+import spacy
+from spacy.matcher import PhraseMatcher
+
+SKILLS_FILE = os.environ.get(
+    "ASCENDX_SKILLS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills.txt")
+)
+
+# Education entities are only looked for around these keywords
+EDUCATION_PATTERN = re.compile(r"university|college|institute", re.IGNORECASE)
+EDUCATION_WINDOW = 100
+
+# Load NLP model; skills only need the tokenizer and education only needs NER,
+# so the tagger, parser and lemmatizer are never run
+nlp = spacy.load("en_core_web_sm", disable=["tagger", "parser", "attribute_ruler", "lemmatizer"])
+
+def load_skill_vocabulary(path=SKILLS_FILE):
+    with open(path, encoding="utf-8") as f:
+        return sorted({line.strip().lower() for line in f if line.strip() and not line.startswith("#")})
+
+def build_skill_matcher(vocabulary):
+    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    matcher.add("SKILL", list(nlp.tokenizer.pipe(vocabulary)))
+    return matcher
+
+skill_matcher = build_skill_matcher(load_skill_vocabulary())
+
+# Resume Parsing
+# Pages and paragraphs are pulled one at a time and extraction stops at the caps
+MAX_PAGES = 10
+MAX_TEXT_CHARS = 50_000
+
+def extract_text_from_pdf(file, max_pages=MAX_PAGES, max_chars=MAX_TEXT_CHARS):
+    if isinstance(file, str):
+        doc = fitz.open(file)
+    else:
+        doc = fitz.open(stream=file.read(), filetype="pdf")
+    parts, size = [], 0
+    with doc:
+        for page_no, page in enumerate(doc):
+            if page_no >= max_pages or size >= max_chars:
+                break
+            text = page.get_text()
+            parts.append(text)
+            size += len(text)
+    return " ".join(parts)[:max_chars]
+
+def extract_text_from_docx(file, max_chars=MAX_TEXT_CHARS):
+    doc = docx.Document(file)
+    parts, size = [], 0
+    for para in doc.paragraphs:
+        if size >= max_chars:
+            break
+        parts.append(para.text)
+        size += len(para.text)
+    return " ".join(parts)[:max_chars]
+
+def extract_text(file, name):
+    return extract_text_from_pdf(file) if name.endswith(".pdf") else extract_text_from_docx(file)
+
+def _match_skills(doc):
+    skills = []
+    for _, start, end in skill_matcher(doc):
+        skill = doc[start:end].text.lower()
+        if skill not in skills:
+            skills.append(skill)
+    return skills
+
+def _education_windows(text):
+    # Merge overlapping windows around each education keyword
+    spans = []
+    for m in EDUCATION_PATTERN.finditer(text):
+        start = max(0, m.start() - EDUCATION_WINDOW)
+        end = min(len(text), m.end() + EDUCATION_WINDOW)
+        if spans and start <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], end)
+        else:
+            spans.append((start, end))
+    return [text[start:end] for start, end in spans]
+
+def extract_resume_info_batch(texts, batch_size=32):
+    texts = list(texts)
+    skills = [_match_skills(doc) for doc in nlp.tokenizer.pipe(texts, batch_size=batch_size)]
+
+    windows = [(i, window) for i, text in enumerate(texts) for window in _education_windows(text)]
+    education = [[] for _ in texts]
+    ner_docs = nlp.pipe((window for _, window in windows), batch_size=batch_size)
+    for (i, _), doc in zip(windows, ner_docs):
+        for ent in doc.ents:
+            if ent.label_ == "ORG" and EDUCATION_PATTERN.search(ent.text) and ent.text not in education[i]:
+                education[i].append(ent.text)
+
+    return [
+        {"skills": ", ".join(s), "education": ", ".join(e)}
+        for s, e in zip(skills, education)
+    ]
+
+def extract_resume_info(text):
+    return extract_resume_info_batch([text])[0]
@@ -0,0 +1,130 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+import contextlib
+from collections import OrderedDict
+
+CACHE_PATH = os.environ.get("ASCENDX_ROADMAP_CACHE", "roadmap_cache.sqlite3")
+CACHE_TTL = float(os.environ.get("ASCENDX_ROADMAP_CACHE_TTL", str(7 * 24 * 3600)))
+CACHE_MAX_BYTES = int(os.environ.get("ASCENDX_ROADMAP_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+MEMORY_ENTRIES = 256
+
+
+def normalize_inputs(current_role, target_role, timeframe):
+    def clean(value):
+        return re.sub(r"\s+", " ", value).strip().lower()
+    return clean(current_role), clean(target_role), clean(timeframe)
+
+
+def roadmap_prompt(current_role, target_role, timeframe):
+    # The prompt quro.py sends; load_test.py replays the same one
+    return (
+        f"Generate a detailed, step-by-step career roadmap for transitioning from "
+        f"{current_role} to {target_role} in {timeframe}.\n"
+        "Include:\n"
+        "1. Skills to learn (with free course links)\n"
+        "2. Projects to build\n"
+        "3. Job search strategies.\n"
+        "Format as a numbered list with deadlines."
+    )
+
+
+def roadmap_key(current_role, target_role, timeframe):
+    return hashlib.sha256("|".join(normalize_inputs(current_role, target_role, timeframe)).encode("utf-8")).hexdigest()
+
+
+# Two tiers: an in-process LRU in front of a local SQLite store shared by all
+# workers on the host. Disk entries expire after the TTL and the oldest are
+# evicted once the store grows past max_bytes.
+class RoadmapCache:
+    def __init__(self, path=CACHE_PATH, ttl=CACHE_TTL, max_bytes=CACHE_MAX_BYTES, memory_entries=MEMORY_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS roadmaps ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS roadmaps_accessed ON roadmaps (accessed)")
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # One short-lived connection per operation: committed, then closed
+        db = sqlite3.connect(self.path, timeout=5)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _remember(self, key, value, created):
+        self._memory[key] = (value, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[1] < self.ttl:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return entry[0]
+            self._memory.pop(key, None)
+
+        with self._connect() as db:
+            row = db.execute("SELECT value, created FROM roadmaps WHERE key = ?", (key,)).fetchone()
+            if row is not None and now - row[1] < self.ttl:
+                db.execute("UPDATE roadmaps SET accessed = ? WHERE key = ?", (now, key))
+            elif row is not None:
+                db.execute("DELETE FROM roadmaps WHERE key = ?", (key,))
+                row = None
+
+        with self._lock:
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["disk_hits"] += 1
+            self._remember(key, row[0], row[1])
+        return row[0]
+
+    def put(self, key, value):
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO roadmaps (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now)
+            )
+            self._evict(db, now)
+
+    def _evict(self, db, now):
+        expired = db.execute("DELETE FROM roadmaps WHERE created < ?", (now - self.ttl,)).rowcount
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM roadmaps").fetchone()[0]
+        evicted = 0
+        if total > self.max_bytes:
+            # Least recently used entries go first
+            for key, size in db.execute("SELECT key, size FROM roadmaps ORDER BY accessed").fetchall():
+                if total <= self.max_bytes:
+                    break
+                db.execute("DELETE FROM roadmaps WHERE key = ?", (key,))
+                total -= size
+                evicted += 1
+        with self._lock:
+            self.stats["evictions"] += expired + evicted
+
+    def hit_rate(self):
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        lookups = hits + self.stats["misses"]
+        return hits / lookups if lookups else 0.0
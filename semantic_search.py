@@ -0,0 +1,80 @@
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.preprocessing import normalize
+from job_search import select_top_k
+
+N_COMPONENTS = 128
+DEFAULT_NPROBE = 8
+
+
+# Optional semantic mode: TF-IDF rows are projected to a dense LSA space
+# (TruncatedSVD) and stored as one contiguous, L2-normalized float32 array.
+# Queries are served from an inverted-file ANN index: k-means centroids
+# partition the vectors into lists, and a query only scans the nprobe lists
+# whose centroids are closest. Raising nprobe trades latency for recall.
+class SemanticIndex:
+    def __init__(self, tfidf_matrix, has_link, n_components=N_COMPONENTS, n_lists=None, seed=0):
+        n_docs = tfidf_matrix.shape[0]
+        self.has_link = np.asarray(has_link, dtype=bool)
+        # The SVD is fit on the hashed columns that occur in the corpus, not the
+        # whole hashing space, so the projection is n_components x used columns;
+        # it is kept as float32
+        tfidf_matrix = tfidf_matrix.tocsr()
+        self.columns = np.unique(tfidf_matrix.indices)
+        self.svd = TruncatedSVD(n_components=max(1, min(n_components, n_docs - 1)), random_state=seed)
+        vectors = self.svd.fit_transform(tfidf_matrix[:, self.columns])
+        vectors = np.ascontiguousarray(normalize(vectors), dtype=np.float32)
+        self.svd.components_ = self.svd.components_.astype(np.float32)
+
+        n_lists = n_lists or max(1, int(np.sqrt(n_docs)))
+        quantizer = MiniBatchKMeans(n_clusters=n_lists, random_state=seed, n_init=3, batch_size=4096)
+        labels = quantizer.fit_predict(vectors)
+        self.centroids = np.ascontiguousarray(normalize(quantizer.cluster_centers_), dtype=np.float32)
+
+        # Vectors are kept once, regrouped by list so each probe is one
+        # contiguous scan; list_ids maps each position back to its document
+        order = np.argsort(labels, kind='stable')
+        self.list_ids = order
+        self.list_vectors = vectors[order]
+        del vectors
+        self.list_offsets = np.searchsorted(labels[order], np.arange(n_lists + 1))
+
+    @property
+    def n_lists(self):
+        return len(self.centroids)
+
+    def project(self, tfidf_rows):
+        # Rows in the full TF-IDF space -> normalized float32 LSA vectors
+        projected = self.svd.transform(tfidf_rows.tocsr()[:, self.columns])
+        return np.ascontiguousarray(normalize(projected), dtype=np.float32)
+
+    def embed(self, query_vector):
+        return self.project(query_vector)[0]
+
+    def score(self, query, nprobe=DEFAULT_NPROBE, mask=None):
+        nprobe = min(nprobe, self.n_lists)
+        centroid_scores = self.centroids @ query
+        probes = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        ids, scores = [], []
+        for probe in probes:
+            start, end = self.list_offsets[probe], self.list_offsets[probe + 1]
+            list_ids, list_vectors = self.list_ids[start:end], self.list_vectors[start:end]
+            if mask is not None:
+                keep = mask[list_ids]
+                list_ids, list_vectors = list_ids[keep], list_vectors[keep]
+            ids.append(list_ids)
+            scores.append(list_vectors @ query)
+        return np.concatenate(ids), np.concatenate(scores)
+
+    def score_exact(self, query, mask=None):
+        if mask is None:
+            return self.list_ids, self.list_vectors @ query
+        keep = mask[self.list_ids]
+        return self.list_ids[keep], self.list_vectors[keep] @ query
+
+    def search(self, query_vector, k=100, threshold=0.3, mask=None, nprobe=DEFAULT_NPROBE, exact=False):
+        # Same contract as JobSearchEngine.search: (doc ids, scores, docs above threshold)
+        query = self.embed(query_vector)
+        candidates, scores = self.score_exact(query, mask) if exact else self.score(query, nprobe, mask)
+        return select_top_k(candidates, scores, self.has_link, k, threshold)
@@ -0,0 +1,181 @@
+import os
+import argparse
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+
+SKILLS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills.txt")
+
+TITLES = [
+    "Data Scientist", "Data Engineer", "Data Analyst", "Senior Data Scientist", "Senior Data Engineer",
+    "Machine Learning Engineer", "Business Analyst", "Software Engineer", "Senior Software Engineer",
+    "Python Developer", "Big Data Engineer", "Cloud Engineer", "Web Developer", "Product Analyst",
+    "AI/ML Engineer", "Lead Data Engineer", "Data Science Intern", "Junior Data Analyst",
+]
+CITIES = [
+    "Bangalore", "Mumbai", "Pune", "Hyderabad", "Chennai", "Delhi", "Gurgaon", "Noida",
+    "Kolkata", "Ahmedabad", "Jaipur", "Kochi", "Remote",
+]
+FILLER = (
+    "we are looking for a motivated candidate to join our growing team and work on "
+    "challenging problems with modern tools the role involves building pipelines models "
+    "dashboards and services collaborating with stakeholders across product engineering "
+    "and analytics teams strong communication ownership and a willingness to learn"
+).split()
+UNIVERSITIES = ["Anna University", "Delhi University", "Mumbai University", "Pune Institute of Technology",
+                "Indian Institute of Technology Bombay", "National Institute of Technology Trichy"]
+
+
+def load_skills(path=SKILLS_FILE):
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+class _Listings:
+    # Random draws shared by the three CSV flavours
+    def __init__(self, n, seed, n_companies=None):
+        self.rng = np.random.default_rng(seed)
+        self.n = n
+        self.skills = np.array(load_skills())
+        self.titles = self.rng.choice(TITLES, n)
+        self.cities = self.rng.choice(CITIES, n, p=self._zipf(len(CITIES)))
+        n_companies = n_companies or max(10, n // 20)
+        self.companies = np.char.add("Company ", self.rng.zipf(1.3, n).clip(max=n_companies).astype(str))
+        self.min_years = self.rng.integers(0, 12, n)
+        self.age_days = self.rng.integers(0, 60, n)
+
+    def _zipf(self, k):
+        weights = 1 / np.arange(1, k + 1)
+        return weights / weights.sum()
+
+    def skill_lists(self, low=3, high=9):
+        counts = self.rng.integers(low, high, self.n)
+        picks = self.rng.integers(0, len(self.skills), counts.sum())
+        split = np.split(self.skills[picks], np.cumsum(counts)[:-1])
+        return [", ".join(s) for s in split]
+
+    def descriptions(self, skills, words=60):
+        filler = np.array(FILLER)[self.rng.integers(0, len(FILLER), (self.n, words))]
+        return [
+            f"{title} with {years}+ years of experience in {skill}. {' '.join(text)}"
+            for title, years, skill, text in zip(self.titles, self.min_years, skills, filler)
+        ]
+
+    def with_near_duplicates(self, df, rate):
+        # Reposted listings: same text, different link and date, as scrapers produce.
+        # Every other repost is also retitled, so only the text (MinHash/LSH) can match it.
+        dupes = df.sample(frac=rate, random_state=int(self.rng.integers(1 << 31)))
+        dupes = dupes.assign(**{col: dupes[col] + "?ref=repost" for col in df.columns if "link" in col})
+        retitled = np.arange(len(dupes)) % 2 == 1
+        dupes.loc[retitled, 'job_title'] = dupes.loc[retitled, 'job_title'] + " (Urgent Hiring)"
+        return pd.concat([df, dupes], ignore_index=True)
+
+
+def merged_listings(n, seed=0, duplicate_rate=0.05):
+    # Columns of merged_job_listings.csv (see job_store.MERGED_RENAMES)
+    gen = _Listings(n, seed)
+    skills = gen.skill_lists()
+    today = datetime.now().date()
+    df = pd.DataFrame({
+        "job_title": gen.titles,
+        "company": gen.companies,
+        "location": [f"{city}, India" for city in gen.cities],
+        "description": gen.descriptions(skills),
+        "link": [f"https://jobs.example.com/{seed}/{i}" for i in range(n)],
+        "skills": skills,
+        "date_posted": [(today - timedelta(days=int(d))).isoformat() for d in gen.age_days],
+    })
+    return gen.with_near_duplicates(df, duplicate_rate)
+
+
+def skills_listings(n, seed=1, duplicate_rate=0.05):
+    # Columns of CareerCompass_jobs_with_skills.csv (see job_store.SKILLS_RENAMES)
+    gen = _Listings(n, seed)
+    skills = gen.skill_lists()
+    df = pd.DataFrame({
+        "job_title": gen.titles,
+        "company_name": gen.companies,
+        "job_location": gen.cities,
+        "job_summary": gen.descriptions(skills, words=40),
+        "apply_link": np.where(gen.rng.random(n) < 0.8, [f"https://apply.example.com/{i}" for i in range(n)], ""),
+        "required_skills": skills,
+        "job_posted_date": [f"{d} days ago" for d in gen.age_days],
+    })
+    return gen.with_near_duplicates(df, duplicate_rate)
+
+
+def naukri_listings(n, seed=2):
+    # Columns of naukri_data_science_jobs_india.csv (see dash_data.RENAMES)
+    gen = _Listings(n, seed)
+    spread = gen.rng.integers(1, 6, n)
+    return pd.DataFrame({
+        "Job Title": gen.titles,
+        "Company": gen.companies,
+        "Location": [f"{city}, India" for city in gen.cities],
+        "Job Experience": [f"{lo}-{lo + s} Yrs" for lo, s in zip(gen.min_years, spread)],
+        "Skills/Description": gen.skill_lists(),
+    })
+
+
+def resume_texts(n, seed=3):
+    rng = np.random.default_rng(seed)
+    skills = np.array(load_skills())
+    texts = []
+    for i in range(n):
+        picked = ", ".join(rng.choice(skills, rng.integers(4, 12), replace=False))
+        texts.append(
+            f"Candidate {i}\n{rng.choice(TITLES)} based in {rng.choice(CITIES)}\n\n"
+            f"Education\nB.Tech in Computer Science, {rng.choice(UNIVERSITIES)}, {rng.integers(2010, 2024)}\n\n"
+            f"Skills\n{picked}\n\n"
+            f"Experience\n{rng.integers(0, 12)} years building data products. " +
+            " ".join(rng.choice(FILLER, 80)) + "\n"
+        )
+    return texts
+
+
+def write_resume(text, path):
+    # .docx via python-docx, .pdf via PyMuPDF (the same libraries the parser reads with)
+    if path.endswith(".docx"):
+        import docx
+        document = docx.Document()
+        for line in text.splitlines():
+            document.add_paragraph(line)
+        document.save(path)
+    else:
+        import fitz
+        with fitz.open() as document:
+            page = document.new_page()
+            page.insert_textbox(page.rect + (36, 36, -36, -36), text, fontsize=10)
+            document.save(path)
+
+
+def write_all(out_dir, rows, resumes=0, seed=0):
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {
+        "merged": os.path.join(out_dir, "merged_job_listings.csv"),
+        "skills": os.path.join(out_dir, "jobs_with_skills.csv"),
+        "naukri": os.path.join(out_dir, "naukri_jobs.csv"),
+        "resumes": os.path.join(out_dir, "resumes"),
+    }
+    merged_listings(rows // 2, seed).to_csv(paths["merged"], index=False)
+    skills_listings(rows - rows // 2, seed + 1).to_csv(paths["skills"], index=False)
+    naukri_listings(rows, seed + 2).to_csv(paths["naukri"], index=False)
+    os.makedirs(paths["resumes"], exist_ok=True)
+    for i, text in enumerate(resume_texts(resumes, seed + 3)):
+        write_resume(text, os.path.join(paths["resumes"], f"resume_{i:05d}.{'pdf' if i % 2 else 'docx'}"))
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic job listing CSVs and resumes")
+    parser.add_argument("--rows", type=int, default=10_000,
+                        help="Job listings (10k to 1M), split between the merged and skills CSVs")
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--out", default="synthetic")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    paths = write_all(args.out, args.rows, args.resumes, args.seed)
+    print(f"Wrote {args.rows} job listings, {args.rows} dashboard rows and {args.resumes} resumes to {args.out}")
+    print(f"ASCENDX_MERGED_CSV={paths['merged']} ASCENDX_SKILLS_CSV={paths['skills']} "
+          f"ASCENDX_DASH_CSV={paths['naukri']}")
@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+import bench  # noqa: E402
+
+BASELINE = {"results": {
+    "corpus_load": {"median_s": 0.100},
+    "tfidf_build": {"median_s": 0.500},
+    "dash_charts": {"median_s": 0.050},
+}}
+
+
+def test_slower_case_is_a_regression():
+    results = {"corpus_load": {"median_s": 0.150}, "tfidf_build": {"median_s": 0.510}}
+    assert bench.compare(results, BASELINE, threshold=0.2) == [("corpus_load", 0.100, 0.150, pytest.approx(0.5))]
+
+
+def test_failed_case_with_baseline_is_a_regression():
+    results = {"tfidf_build": {"error": "MemoryError()"}, "dash_charts": {"median_s": 0.050}}
+    assert bench.compare(results, BASELINE) == [("tfidf_build", 0.500, None, None)]
+
+
+def test_failed_case_without_baseline_is_not_flagged():
+    results = {"similarity_semantic": {"error": "OSError()"}}
+    assert bench.compare(results, BASELINE) == []
+
+
+def test_tiny_timings_are_not_flagged():
+    baseline = {"results": {"dash_aggregate": {"median_s": 0.001}}}
+    assert bench.compare({"dash_aggregate": {"median_s": 0.004}}, baseline) == []
@@ -0,0 +1,38 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("sklearn")
+import candidate_match  # noqa: E402
+from tfidf_index import TfidfIndex  # noqa: E402
+
+
+def corpus():
+    # Representatives only, re-indexed from 0 as load_corpus returns them
+    df = pd.DataFrame({
+        "listing_key": ["k-analyst", "k-repost", "k-cloud", "k-web"],
+        "job_title": ["data analyst", "data analyst", "cloud engineer", "web developer"],
+        "company_name": ["acme", "acme", "globex", "initech"],
+        "combined_text": ["data analyst sql excel", "data analyst sql excel",
+                          "cloud engineer aws kubernetes", "web developer javascript react"],
+        "is_representative": [True, False, True, True],
+    })
+    return df[df["is_representative"]].reset_index(drop=True)
+
+
+def test_jobs_are_looked_up_by_listing_key():
+    df = corpus()
+    jobs = candidate_match.jobs_by_key(df, ["k-web", "k-cloud"])
+    assert jobs["job_title"].tolist() == ["web developer", "cloud engineer"]
+    with pytest.raises(KeyError):
+        candidate_match.jobs_by_key(df, ["k-repost"])
+
+
+def test_rank_candidates_is_keyed_by_listing_key():
+    df = corpus()
+    vectorizer = TfidfIndex.build(df["combined_text"].tolist())
+    index = candidate_match.CandidateIndex(vectorizer)
+    index.add(["alice", "bob"], ["aws kubernetes cloud", "react javascript web"])
+    ranked = candidate_match.rank_candidates(candidate_match.jobs_by_key(df, ["k-cloud", "k-web"]), index, k=1)
+    assert [matches[0][0] for matches in ranked.values()] == ["alice", "bob"]
+    assert list(ranked) == ["k-cloud", "k-web"]
@@ -0,0 +1,63 @@
+import time
+import threading
+import pytest
+
+pytest.importorskip("openai")
+from chat_context import ConversationContext  # noqa: E402
+
+
+def conversation(turns):
+    history = [{"role": "system", "content": "You are a career coach."}]
+    for i in range(turns):
+        role = "user" if i % 2 == 0 else "assistant"
+        history.append({"role": role, "content": f"turn {i} " + "word " * 40})
+    return history
+
+
+def has_summary(messages):
+    return any(m["content"].startswith("Summary of the earlier conversation") for m in messages)
+
+
+def test_build_does_not_wait_for_the_summary():
+    release, calls = threading.Event(), []
+
+    def summarizer(summary, messages):
+        calls.append(len(messages))
+        release.wait(5)
+        return "earlier turns"
+
+    context = ConversationContext(budget=200, summary_tokens=50, summarizer=summarizer)
+    history = conversation(8)
+    start = time.monotonic()
+    first = context.build(history)
+    second = context.build(history)
+    assert time.monotonic() - start < 1
+    assert not has_summary(first) and not has_summary(second)
+
+    release.set()
+    context.wait(5)
+    assert context.summary == "earlier turns"
+    assert len(calls) == 1 and calls[0] > 0  # one refresh at a time
+    third = context.build(history)
+    assert third[1]["content"] == "Summary of the earlier conversation: earlier turns"
+    context.wait(5)
+    assert len(calls) == 1  # those turns are folded in once
+
+
+def test_failed_summary_is_retried_on_the_next_turn():
+    calls = []
+
+    def summarizer(summary, messages):
+        calls.append(summary)
+        if len(calls) == 1:
+            raise RuntimeError("upstream down")
+        return "recovered"
+
+    context = ConversationContext(budget=200, summary_tokens=50, summarizer=summarizer)
+    history = conversation(8)
+    context.build(history)
+    context.wait(5)
+    assert context.summary == "" and context.summarized_upto == 1
+    context.build(history)
+    context.wait(5)
+    assert context.summary == "recovered" and len(calls) == 2
@@ -0,0 +1,28 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("plotly")
+from dash_charts import weighted_quantiles, sample_points  # noqa: E402
+
+QS = [0, 0.1, 0.25, 0.5, 0.75, 0.9, 1]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_weighted_quantiles_match_the_expanded_sample(seed):
+    rng = np.random.default_rng(seed)
+    values = rng.choice(np.arange(30.0), size=rng.integers(1, 12), replace=False)
+    counts = rng.integers(1, 20, len(values))
+    expected = np.quantile(np.repeat(values, counts), QS)
+    np.testing.assert_allclose(weighted_quantiles(values, counts, QS), expected)
+
+
+def test_weighted_quantiles_of_a_single_value():
+    np.testing.assert_allclose(weighted_quantiles([4.0], [7], QS), [4.0] * len(QS))
+
+
+def test_sample_points_is_capped_and_stable():
+    values, counts = np.arange(10.0), np.full(10, 100)
+    points = sample_points(values, counts, max_points=50)
+    assert len(points) == 50 and set(points) <= set(values)
+    np.testing.assert_array_equal(points, sample_points(values, counts, max_points=50))
+    assert len(sample_points(values[:2], [3, 4], max_points=50)) == 7
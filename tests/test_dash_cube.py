@@ -0,0 +1,73 @@
+import math
+import pytest
+
+pd = pytest.importorskip("pandas")
+import synth_data  # noqa: E402
+from dash_data import load_job_table  # noqa: E402
+from dash_cube import FilterCube, TOKEN_PATTERN  # noqa: E402
+
+FILTERS = [
+    ("All", [], None),
+    ("Data Scientist", [], None),
+    ("All", ["Bangalore", "Pune"], None),
+    ("All", [], 7),
+    ("Data Engineer", ["Mumbai"], 30),
+    ("No Such Role", [], None),
+]
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    path = tmp_path_factory.mktemp("dash") / "naukri.csv"
+    synth_data.naukri_listings(2000, seed=5).to_csv(path, index=False)
+    return load_job_table(str(path))
+
+
+@pytest.fixture(scope="module")
+def cube(table):
+    return FilterCube(table, table.attrs['loaded_at'], text_column='Skills/Description', stopwords={"and"})
+
+
+def rows_for(table, role, locations, max_days):
+    rows = table
+    if role != "All":
+        rows = rows[rows['Job_Role'] == role]
+    if locations:
+        rows = rows[rows['Location'].isin(locations)]
+    if max_days is not None:
+        rows = rows[(pd.Timestamp(table.attrs['loaded_at']) - rows['Posted Date']).dt.days < max_days]
+    return rows
+
+
+@pytest.mark.parametrize("role, locations, max_days", FILTERS)
+def test_slice_metrics_match_row_filtering(table, cube, role, locations, max_days):
+    rows = rows_for(table, role, locations, max_days)
+    part = cube.slice(role, locations, max_days)
+    assert part.total_jobs() == len(rows)
+    assert part.location_count() == rows['Location'].nunique()
+    assert part.company_count() == rows['Company'].nunique()
+    expected = rows['Experience Min'].mean()
+    assert (math.isnan(part.avg_experience()) and math.isnan(expected)) or part.avg_experience() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("role, locations, max_days", FILTERS)
+def test_slice_tables_match_row_filtering(table, cube, role, locations, max_days):
+    rows = rows_for(table, role, locations, max_days)
+    part = cube.slice(role, locations, max_days)
+    for column in ('Location', 'Company', 'Job_Role'):
+        counts = rows[column].value_counts()
+        top = part.top(column, n=len(counts) + 1)
+        assert dict(zip(top[column], top['Count'])) == counts[counts > 0].to_dict()
+
+    experience = rows.groupby(['Job_Role', 'Experience Min'], observed=True).size()
+    got = part.experience_counts().set_index(['Job_Role', 'Experience Min'])['count']
+    assert got.sort_index().to_dict() == experience[experience > 0].sort_index().to_dict()
+
+
+def test_term_frequencies_match_row_tokens(table, cube):
+    rows = rows_for(table, "Data Analyst", [], None)
+    tokens = rows['Skills/Description'].str.lower().str.findall(TOKEN_PATTERN).explode()
+    tokens = tokens[(tokens != "and") & ~tokens.str.isdigit()]
+    expected = tokens.value_counts()
+    got = cube.slice("Data Analyst").term_frequencies(max_words=len(expected))
+    assert got == expected.to_dict()
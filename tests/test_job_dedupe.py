@@ -0,0 +1,76 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+import job_dedupe  # noqa: E402
+from job_dedupe import ClusterIndex, assign_clusters, signatures  # noqa: E402
+
+DESCRIPTION = (
+    "build and maintain batch and streaming data pipelines in python and sql, model warehouse tables, "
+    "own data quality checks, work with analysts on dashboards and mentor junior engineers on the team. "
+    "you will design schemas for event data, tune spark jobs on the cluster, automate deployments with "
+    "airflow and terraform, and document every dataset so that product managers can self serve reports"
+)
+
+
+def postings(rows):
+    df = pd.DataFrame(rows, columns=["job_title", "company_name", "job_location", "description"])
+    df["listing_key"] = [f"key-{i}" for i in range(len(df))]
+    df["combined_text"] = df["job_title"] + " " + df["description"] + " " + df["job_location"]
+    return df
+
+
+def cluster(df, index=None):
+    return assign_clusters(df, signatures(df["combined_text"]), index)
+
+
+def test_exact_key_is_none_when_a_field_is_blank():
+    df = postings([("data engineer", "", "", "x"), ("data engineer", "acme", "pune", "x")])
+    assert job_dedupe.exact_keys(df) == [None, "data engineer|acme|pune"]
+
+
+def test_blank_company_and_location_do_not_merge_unrelated_postings():
+    df = postings([
+        ("data engineer", "", "", DESCRIPTION),
+        ("data engineer", "", "", "support production kubernetes clusters and on call rotations for payments"),
+    ])
+    assert cluster(df)["is_representative"].tolist() == [True, True]
+
+
+def test_same_title_company_and_location_merge():
+    df = postings([("data engineer", "acme", "pune", DESCRIPTION), ("Data Engineer ", "ACME", "pune", "short")])
+    out = cluster(df)
+    assert out["is_representative"].tolist() == [True, False]
+    assert out["cluster_id"].tolist() == ["key-0", "key-0"]
+
+
+def test_reworded_repost_is_matched_through_lsh():
+    # Different title, so only the MinHash/LSH path can pair them
+    df = postings([
+        ("data engineer", "acme", "pune", DESCRIPTION),
+        ("data engineer (urgent hiring)", "acme", "pune", DESCRIPTION),
+        ("frontend developer", "globex", "delhi", "react typescript design systems accessibility and testing"),
+    ])
+    out = cluster(df)
+    assert out["cluster_id"].tolist() == ["key-0", "key-0", "key-2"]
+    assert out["is_representative"].tolist() == [True, False, True]
+
+
+def test_persisted_index_matches_later_ingests(tmp_path):
+    path = str(tmp_path / "clusters.sqlite3")
+    first = postings([("data engineer", "acme", "pune", DESCRIPTION), ("data engineer", "", "", "unrelated text")])
+    with ClusterIndex(path) as index:
+        first = cluster(first, index)
+        index.add(first, signatures(first["combined_text"]))
+
+    later = postings([
+        ("senior data engineer", "acme", "pune", DESCRIPTION),
+        ("data engineer", "acme", "pune", "rewritten"),
+        ("data engineer", "", "", "something else entirely about payroll and benefits administration"),
+    ])
+    later["listing_key"] = ["key-a", "key-b", "key-c"]
+    with ClusterIndex(path) as index:
+        assert len(index) == 2
+        out = cluster(later, index)
+    assert out["cluster_id"].tolist() == ["key-0", "key-0", "key-c"]
+    assert out["is_representative"].tolist() == [False, False, True]
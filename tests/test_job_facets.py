@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+from job_facets import FacetIndex, posted_age_days  # noqa: E402
+
+BUILT = datetime(2024, 5, 10, 12, 0)
+
+
+@pytest.fixture
+def facets():
+    df = pd.DataFrame({
+        "job_title": ["data analyst", "senior data engineer", "data science intern", "cloud engineer"],
+        "job_description": ["sql dashboards", "5+ years of spark", "fresher friendly", "aws"],
+        "job_location": ["pune, maharashtra", "remote", "mumbai", "pune"],
+        "apply_link": ["https://a", "", "https://c", "https://d"],
+        "job_posted_date": ["12 hours ago", "2024-05-08", "3 weeks ago", "not a date"],
+    })
+    return FacetIndex(df, reference_time=BUILT)
+
+
+def test_posted_filters_use_the_query_time(facets):
+    assert facets.mask(max_age_days=1, now=BUILT).tolist() == [True, False, False, False]
+    assert facets.mask(max_age_days=7, now=BUILT).tolist() == [True, True, False, False]
+    # Two days later the 12-hour-old posting is no longer from the last 24 hours
+    assert facets.mask(max_age_days=1, now=BUILT + timedelta(days=2)).tolist() == [False, False, False, False]
+    assert facets.mask(max_age_days=30, now=BUILT + timedelta(days=2)).tolist() == [True, True, True, False]
+
+
+def test_location_and_experience_filters(facets):
+    cities, unknown, remote = facets.parse_locations("Pune, Remote, Atlantis")
+    assert (cities, unknown, remote) == (["pune"], ["atlantis"], True)
+    assert facets.mask(cities, remote).tolist() == [True, True, False, True]
+    assert facets.mask(experience="Fresher").tolist() == [True, False, True, True]
+    assert facets.mask(experience="Experienced").tolist() == [True, True, False, True]
+    assert facets.mask() is None
+
+
+def test_mixed_absolute_date_formats_are_all_read():
+    posted = pd.Series(["2024-05-08", "May 6, 2024", "05/03/2024", "2 days ago", "someday"])
+    age = posted_age_days(posted, datetime(2024, 5, 10))
+    np.testing.assert_allclose(age[:4], [2, 4, 7, 2])
+    assert np.isnan(age[4])
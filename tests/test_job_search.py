@@ -0,0 +1,64 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+sp = pytest.importorskip("scipy.sparse")
+from sklearn.preprocessing import normalize  # noqa: E402
+from job_search import JobSearchEngine, select_top_k  # noqa: E402
+
+N_DOCS, N_FEATURES = 400, 2 ** 18
+
+
+@pytest.fixture(scope="module")
+def engine():
+    matrix = normalize(sp.random(N_DOCS, N_FEATURES, density=2e-5, format='csr', random_state=1, dtype=float))
+    # A few shared, frequent terms so queries have long postings lists
+    common = sp.random(N_DOCS, 4, density=0.5, format='csr', random_state=2)
+    matrix = normalize(sp.hstack([common, matrix[:, 4:]], format='csr'))
+    return JobSearchEngine(matrix, np.arange(N_DOCS) % 3 == 0)
+
+
+def query(engine, terms):
+    data = np.linspace(1, 2, len(terms))
+    return normalize(sp.csr_matrix((data, (np.zeros(len(terms), dtype=int), terms)), shape=(1, N_FEATURES)))
+
+
+def dense_scores(engine, q, mask=None):
+    scores = (engine.matrix @ q.T).toarray().ravel()
+    if mask is not None:
+        scores[~mask] = 0
+    return {i: s for i, s in enumerate(scores) if s > 0}
+
+
+def as_dict(ids, scores):
+    return dict(zip(ids.tolist(), scores.tolist()))
+
+
+@pytest.mark.parametrize("mask_every", [None, 1, 2, 50])
+def test_scores_match_a_dense_product(engine, mask_every):
+    mask = None if mask_every is None else np.arange(N_DOCS) % mask_every == 0
+    q = query(engine, [0, 1, 2, 3, 7000, 91000])
+    got = as_dict(*engine.score(q, mask))
+    expected = dense_scores(engine, q, mask)
+    assert got.keys() == expected.keys()
+    assert np.allclose([got[i] for i in expected], list(expected.values()))
+
+
+def test_row_scoring_matches_postings(engine):
+    q = query(engine, [3, 1, 2])
+    rows = np.arange(0, N_DOCS, 5)
+    ids, scores = engine.score_rows(rows, q.indices, q.data)
+    expected = dense_scores(engine, q, np.isin(np.arange(N_DOCS), rows))
+    assert np.allclose([as_dict(ids, scores)[i] for i in expected], list(expected.values()))
+    assert set(ids.tolist()) == set(expected)
+
+
+def test_empty_query_scores_nothing(engine):
+    ids, scores = engine.score(sp.csr_matrix((1, N_FEATURES)))
+    assert len(ids) == len(scores) == 0
+
+
+def test_select_top_k_ranks_linked_postings_first():
+    ids, scores, total = select_top_k(
+        np.array([0, 1, 2, 3]), np.array([0.9, 0.5, 0.1, 0.6]), np.array([False, True, True, False]), k=3, threshold=0.2
+    )
+    assert ids.tolist() == [1, 0, 3] and total == 3
@@ -0,0 +1,46 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+import job_store  # noqa: E402
+
+
+def merged_csv(path, rows):
+    pd.DataFrame([
+        {"job_title": title, "company": company, "location": "Pune, India",
+         "description": f"{title} role at {company}", "link": f"https://jobs.example.com/{i}",
+         "skills": "python, sql", "date_posted": "2024-05-01"}
+        for i, (title, company) in enumerate(rows)
+    ]).to_csv(path, index=False)
+    return path
+
+
+def empty_skills_csv(path):
+    pd.DataFrame(columns=["job_title", "company_name", "job_location", "job_summary",
+                          "apply_link", "required_skills", "job_posted_date"]).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def sources(tmp_path):
+    return tmp_path / "store", empty_skills_csv(tmp_path / "skills.csv")
+
+
+def test_rebuild_changes_store_version(tmp_path, sources):
+    store, skills = sources
+    job_store.build_store(merged_csv(tmp_path / "a.csv", [("Data Analyst", "Acme")]), skills, store)
+    before = job_store.store_version(store)
+    job_store.build_store(merged_csv(tmp_path / "b.csv", [("Cloud Engineer", "Globex")]), skills, store)
+    assert job_store.store_version(store) != before
+    assert job_store.load_corpus(store)['job_title'].tolist() == ["cloud engineer"]
+
+
+def test_ingest_appends_only_new_listings(tmp_path, sources):
+    store, skills = sources
+    job_store.build_store(merged_csv(tmp_path / "a.csv", [("Data Analyst", "Acme")]), skills, store)
+    before = job_store.store_version(store)
+    rows = [("Data Analyst", "Acme"), ("Cloud Engineer", "Globex")]
+    assert job_store.ingest(merged_csv(tmp_path / "b.csv", rows), "merged", store) == 1
+    assert job_store.ingest(merged_csv(tmp_path / "c.csv", rows), "merged", store) == 0
+    assert job_store.store_version(store) != before
+    assert job_store.load_corpus(store)['job_title'].tolist() == ["data analyst", "cloud engineer"]
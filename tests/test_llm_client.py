@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("openai")
+import llm_client  # noqa: E402
+
+
+def test_remote_backend_requires_an_api_key(monkeypatch):
+    monkeypatch.setattr(llm_client, "LLM_BACKEND", "remote")
+    monkeypatch.setattr(llm_client, "LLM_API_KEY", "")
+    with pytest.raises(RuntimeError, match="ASCENDX_LLM_API_KEY"):
+        llm_client._client_options()
+
+
+def test_local_backend_runs_without_a_key(monkeypatch):
+    monkeypatch.setattr(llm_client, "LLM_BACKEND", "local")
+    monkeypatch.setattr(llm_client, "LLM_API_KEY", "")
+    assert llm_client._client_options()["api_key"]
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    import threading
+    import fake_llm_server
+
+    server = fake_llm_server.serve(port=0, config=fake_llm_server.FakeLLMConfig(
+        latency=0.0, jitter=0.0, tokens_per_sec=1000.0, completion_tokens=5
+    ))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(llm_client, "LLM_BACKEND", "local")
+    monkeypatch.setattr(llm_client, "LLM_API_KEY", "")
+    monkeypatch.setattr(llm_client, "LLM_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+    monkeypatch.setattr(llm_client, "_async_client", None)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_interface_against_fake_server(fake_server):
+    import asyncio
+
+    async def run():
+        messages = [{"role": "user", "content": "Plan my next month"}]
+        text = await llm_client.acomplete(messages, max_tokens=5)
+        deltas = [delta async for delta in llm_client.astream(messages, max_tokens=5)]
+        return text, deltas
+
+    text, deltas = asyncio.run(run())
+    assert text.strip()
+    assert len(deltas) > 1 and "".join(deltas).strip()
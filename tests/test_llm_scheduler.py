@@ -0,0 +1,89 @@
+import threading
+import email.utils
+from datetime import datetime, timedelta, timezone
+import pytest
+
+openai = pytest.importorskip("openai")
+httpx = pytest.importorskip("httpx")
+import llm_client  # noqa: E402
+import llm_scheduler  # noqa: E402
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    # Stands in for llm_client.stream: records each call and holds it until released
+    class Upstream:
+        def __init__(self):
+            self.calls = []
+            self.release = threading.Event()
+            self.failures = []
+
+        def stream(self, messages, model="gpt-3.5-turbo", **params):
+            self.calls.append(messages[-1]["content"])
+            self.release.wait(5)
+            if self.failures:
+                raise self.failures.pop(0)
+            yield "ok"
+
+    fake = Upstream()
+    monkeypatch.setattr(llm_client, "stream", fake.stream)
+    return fake
+
+
+def ask(text):
+    return [{"role": "user", "content": text}]
+
+
+def scheduler(**options):
+    return llm_scheduler.LLMScheduler(**{"max_concurrency": 1, "rate": 1000, "burst": 1000, **options})
+
+
+def test_chat_is_served_before_queued_background_work(upstream):
+    s = scheduler()
+    first = s.stream(ask("first"), priority=llm_scheduler.ROADMAP)
+    background = s.stream(ask("background"), priority=llm_scheduler.BACKGROUND)
+    chat = s.stream(ask("chat"), priority=llm_scheduler.CHAT)
+    assert s.position(chat.ticket) == 1 and s.position(background.ticket) == 2
+    upstream.release.set()
+    assert ["".join(r) for r in (first, background, chat)] == ["ok", "ok", "ok"]
+    assert upstream.calls == ["first", "chat", "background"]
+
+
+def test_identical_requests_share_one_upstream_call(upstream):
+    s = scheduler()
+    a = s.stream(ask("same"), temperature=0.2)
+    b = s.stream(ask("same"), temperature=0.2)
+    assert a is b
+    upstream.release.set()
+    assert "".join(a) == "ok" and "".join(b) == "ok"
+    assert upstream.calls == ["same"]
+    assert s.stats["coalesced"] == 1 and s.stats["requests"] == 1
+
+
+def test_full_queue_rejects(upstream):
+    s = scheduler(max_queue=1)
+    s.stream(ask("running"))
+    s.stream(ask("queued"))
+    with pytest.raises(llm_scheduler.SchedulerBusy):
+        s.stream(ask("rejected"))
+    assert s.stats["rejected"] == 1
+    upstream.release.set()
+
+
+def test_rate_limited_request_is_requeued(upstream):
+    response = httpx.Response(429, headers={"retry-after": "0"}, request=httpx.Request("POST", "http://llm/v1"))
+    upstream.failures.append(openai.RateLimitError("slow down", response=response, body=None))
+    upstream.release.set()
+    s = scheduler()
+    assert s.complete(ask("retry")) == "ok"
+    assert upstream.calls == ["retry", "retry"]
+    assert s.stats["rate_limited"] == 1
+
+
+def test_retry_delay_accepts_seconds_and_http_dates():
+    assert llm_scheduler.retry_delay("3", 0) == 3.0
+    later = email.utils.format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= llm_scheduler.retry_delay(later, 0) <= 30
+    assert llm_scheduler.retry_delay("Wed, 21 Oct 2015 07:28:00 GMT", 0) == 0.0
+    assert llm_scheduler.retry_delay("soon", 2) == 4.0
+    assert llm_scheduler.retry_delay(None, 1) == 2.0
@@ -0,0 +1,60 @@
+import socket
+import time
+import pytest
+import load_test
+
+
+def test_wait_for_server_returns_once_the_port_accepts():
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        start = time.monotonic()
+        load_test.wait_for_server(f"http://127.0.0.1:{listener.getsockname()[1]}/v1")
+        assert time.monotonic() - start < 1
+
+
+def test_wait_for_server_gives_up():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    with pytest.raises(SystemExit):
+        load_test.wait_for_server(f"http://127.0.0.1:{port}/v1", timeout=0.2)
+
+
+def test_wait_for_server_stops_when_the_process_exits():
+    class Exited:
+        returncode = 1
+
+        def poll(self):
+            return self.returncode
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    with pytest.raises(SystemExit, match="status 1"):
+        load_test.wait_for_server(f"http://127.0.0.1:{port}/v1", Exited(), timeout=30)
+
+
+def test_run_routes_requests_through_the_scheduler(monkeypatch):
+    pytest.importorskip("openai")
+    import argparse
+    import llm_client
+    import llm_scheduler
+
+    calls = []
+
+    def fake_stream(messages, model="gpt-3.5-turbo", **params):
+        calls.append(model)
+        yield "chunk "
+        yield "done"
+
+    monkeypatch.setattr(llm_client, "stream", fake_stream)
+    monkeypatch.setattr(llm_scheduler, "_scheduler", llm_scheduler.LLMScheduler(rate=1000, burst=1000))
+    args = argparse.Namespace(chat_sessions=2, chat_turns=2, roadmap_users=2, roadmap_requests=2,
+                              think_time=0.0, roadmap_cache=None)
+    report = load_test.run(args)
+    assert report["chat"]["requests"] == 4 and report["chat"]["errors"] == 0
+    assert report["roadmap"]["requests"] == 4 and report["roadmap"]["errors"] == 0
+    stats = report["scheduler"]
+    assert stats["requests"] + stats["coalesced"] == 8
+    assert len(calls) == stats["requests"]
@@ -0,0 +1,39 @@
+import os
+import json
+import perf
+
+
+def test_log_rotates_at_max_bytes(tmp_path, monkeypatch):
+    path = str(tmp_path / "perf_log.jsonl")
+    monkeypatch.setattr(perf, "PERF_LOG", path)
+    monkeypatch.setattr(perf, "PERF_LOG_MAX_BYTES", 2000)
+    for i in range(200):
+        perf.record("rotate_test", 0.001, step=i)
+    files = sorted(os.listdir(tmp_path))
+    assert files == ["perf_log.jsonl", "perf_log.jsonl.1", "perf_log.jsonl.2", "perf_log.jsonl.3"]
+    for name in files:
+        assert os.path.getsize(tmp_path / name) <= 2000
+    with open(path, encoding="utf-8") as f:
+        steps = [json.loads(line)["step"] for line in f]
+    assert steps[-1] == 199
+
+
+def test_empty_path_disables_log(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(perf, "PERF_LOG", "")
+    perf.record("disabled_test", 0.001)
+    assert os.listdir(tmp_path) == []
+
+
+def test_rss_delta_is_labelled_process_wide(tmp_path, monkeypatch):
+    path = str(tmp_path / "perf_log.jsonl")
+    monkeypatch.setattr(perf, "PERF_LOG", path)
+    perf.record("rss_test", 0.01, 4096)
+    with open(path, encoding="utf-8") as f:
+        entry = json.loads(f.readline())
+    assert entry["process_rss_delta"] == 4096
+    assert "memory_delta" not in entry
+    text = perf.render_metrics()
+    assert 'ascendx_stage_process_rss_delta_bytes{app="' in text
+    assert 'stage="rss_test"} 4096' in text
+    assert "ascendx_stage_memory_delta_bytes" not in text
@@ -0,0 +1,67 @@
+import json
+import random
+import pytest
+from question_bank import QuestionBank, read_questions, validate
+
+
+def question(text, answer=0):
+    return {"question": text, "options": ["a", "b", "c"], "answer": answer}
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "bank.sqlite3")
+
+
+@pytest.fixture
+def bank(path):
+    bank = QuestionBank(path, seed_path=None)
+    bank.import_questions([("Data Analyst", question("q1")), ("Data Analyst", question("q2")),
+                           ("Cloud Engineer", question("q3"))])
+    return bank
+
+
+def test_roles_and_samples(bank):
+    assert bank.roles() == ["Data Analyst", "Cloud Engineer"]
+    sample = bank.sample("Data Analyst", 10, random.Random(0))
+    assert sorted(q["question"] for q in sample) == ["q1", "q2"]
+    assert bank.counts() == {"Cloud Engineer": 1, "Data Analyst": 2}
+
+
+def test_reimport_updates_existing_questions(bank):
+    bank.import_questions([("Data Analyst", question("q1", answer=2))])
+    assert [q["answer"] for q in bank.load_role("Data Analyst")] == [2, 0]
+
+
+def test_imports_from_another_process_are_picked_up(bank, path):
+    assert len(bank.load_role("Data Analyst")) == 2
+    # e.g. `python question_bank.py import ...` while the app is running
+    QuestionBank(path, seed_path=None).import_questions(
+        [("Data Analyst", question("q4")), ("Web Developer", question("q5"))]
+    )
+    assert len(bank.load_role("Data Analyst")) == 3
+    assert "Web Developer" in bank.roles()
+
+
+def test_cached_role_is_reused_without_imports(bank):
+    assert bank.load_role("Cloud Engineer") is bank.load_role("Cloud Engineer")
+
+
+@pytest.mark.parametrize("item", [
+    {"question": "", "options": ["a", "b"], "answer": 0},
+    {"question": "q", "options": ["a"], "answer": 0},
+    {"question": "q", "options": ["a", "a"], "answer": 0},
+    {"question": "q", "options": ["a", "b"], "answer": 2},
+])
+def test_invalid_questions_are_rejected(item):
+    with pytest.raises(ValueError):
+        validate("Role", item)
+
+
+def test_export_round_trips(bank, tmp_path):
+    out = tmp_path / "export.json"
+    bank.export(str(out))
+    assert json.loads(out.read_text())["Cloud Engineer"] == [question("q3")]
+    assert list(read_questions(str(out))) == [
+        ("Data Analyst", question("q1")), ("Data Analyst", question("q2")), ("Cloud Engineer", question("q3"))
+    ]
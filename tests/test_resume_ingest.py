@@ -0,0 +1,44 @@
+import os
+import pytest
+import resume_ingest
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # The cache directory is relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    skills = tmp_path / "skills.txt"
+    skills.write_text("python\nsql\n")
+    monkeypatch.setattr(resume_ingest, "SKILLS_FILE", str(skills))
+    return tmp_path
+
+
+def test_uploads_over_the_size_cap_are_rejected(workdir):
+    data = b"x" * (resume_ingest.MAX_FILE_BYTES + 1)
+    with pytest.raises(ValueError):
+        resume_ingest.parse_upload(data, "huge.pdf")
+    with pytest.raises(ValueError):
+        resume_ingest.submit_upload(data, "huge.pdf", pool=None)
+
+
+def test_cache_key_follows_the_skills_vocabulary(workdir):
+    data = b"%PDF resume bytes"
+    before = resume_ingest.cache_key(data)
+    assert resume_ingest.cache_key(data) == before
+    skills = workdir / "skills.txt"
+    skills.write_text("python\nsql\nkubernetes\n")
+    stat = os.stat(skills)
+    os.utime(skills, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert resume_ingest.cache_key(data) != before
+
+
+def test_cache_hits_skip_the_pool(workdir):
+    data = b"%PDF cached resume"
+    resume_ingest.cache_put(resume_ingest.cache_key(data), {"hash": "h", "text": "t", "skills": "sql", "education": ""})
+
+    class NoPool:
+        def submit(self, *args):
+            raise AssertionError("cache hit was sent to the pool")
+
+    record = resume_ingest.submit_upload(data, "cv.pdf", NoPool()).result()
+    assert record["cached"] and record["name"] == "cv.pdf" and record["skills"] == "sql"
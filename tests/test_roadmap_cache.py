@@ -0,0 +1,53 @@
+import sqlite3
+import pytest
+import roadmap_cache
+from roadmap_cache import RoadmapCache, roadmap_key
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "roadmaps.sqlite3")
+
+
+def test_key_ignores_case_and_spacing():
+    assert roadmap_key("Intern", "Data  Analyst", "6 months") == roadmap_key(" intern", "data analyst", "6 Months ")
+
+
+def test_disk_tier_is_shared_between_instances(path):
+    RoadmapCache(path).put("k", "roadmap")
+    other = RoadmapCache(path)
+    assert other.get("k") == "roadmap"
+    assert other.get("k") == "roadmap"
+    assert other.stats["disk_hits"] == 1 and other.stats["memory_hits"] == 1
+
+
+def test_expired_entries_are_dropped(path):
+    cache = RoadmapCache(path, ttl=0)
+    cache.put("k", "roadmap")
+    assert cache.get("k") is None
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT COUNT(*) FROM roadmaps").fetchone()[0] == 0
+
+
+def test_least_recently_used_entries_are_evicted(path):
+    cache = RoadmapCache(path, max_bytes=10, memory_entries=0)
+    cache.put("old", "x" * 6)
+    cache.put("new", "y" * 6)
+    assert cache.get("old") is None and cache.get("new") == "y" * 6
+    assert cache.stats["evictions"] == 1
+
+
+def test_connections_are_closed(path, monkeypatch):
+    opened, real_connect = [], sqlite3.connect
+
+    def connect(*args, **kwargs):
+        opened.append(real_connect(*args, **kwargs))
+        return opened[-1]
+    monkeypatch.setattr(roadmap_cache.sqlite3, "connect", connect)
+    cache = RoadmapCache(path, memory_entries=0)
+    cache.put("k", "roadmap")
+    cache.get("k")
+    assert len(opened) == 3
+    for db in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            db.execute("SELECT 1")
@@ -0,0 +1,60 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+from tfidf_index import TfidfIndex  # noqa: E402
+from semantic_search import SemanticIndex  # noqa: E402
+
+WORDS = "python sql spark aws react java kubernetes excel tableau statistics docker linux".split()
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = np.random.default_rng(0)
+    texts = [" ".join(rng.choice(WORDS, 6)) for _ in range(300)]
+    index = TfidfIndex.build(texts)
+    has_link = rng.random(len(texts)) < 0.5
+    return index, SemanticIndex(index.matrix, has_link, n_components=8, n_lists=10), has_link
+
+
+def test_vectors_are_stored_once(corpus):
+    _, semantic, _ = corpus
+    assert not hasattr(semantic, "vectors")
+    assert sorted(semantic.list_ids) == list(range(300))
+
+
+def test_projection_only_covers_used_columns(corpus):
+    index, semantic, _ = corpus
+    used = len(np.unique(index.matrix.indices))
+    assert used < index.matrix.shape[1]
+    assert semantic.svd.components_.dtype == np.float32
+    assert semantic.svd.components_.nbytes <= semantic.svd.n_components * used * 4
+
+
+def test_exact_scores_are_keyed_by_document(corpus):
+    index, semantic, _ = corpus
+    query = semantic.embed(index.transform(["python spark aws"]))
+    ids, scores = semantic.score_exact(query)
+    expected = semantic.project(index.matrix) @ query
+    np.testing.assert_allclose(scores, expected[ids], rtol=1e-4, atol=1e-5)
+
+
+def test_masked_exact_scores_only_eligible_documents(corpus):
+    index, semantic, _ = corpus
+    mask = np.zeros(300, dtype=bool)
+    mask[::7] = True
+    query = semantic.embed(index.transform(["react java"]))
+    ids, scores = semantic.score_exact(query, mask)
+    all_ids, all_scores = semantic.score_exact(query)
+    assert sorted(ids) == list(np.flatnonzero(mask))
+    np.testing.assert_allclose(dict(zip(ids, scores))[ids[0]], dict(zip(all_ids, all_scores))[ids[0]])
+
+
+def test_probing_every_list_matches_exact_search(corpus):
+    index, semantic, _ = corpus
+    query = index.transform(["sql excel tableau"])
+    approx = semantic.search(query, k=10, threshold=0.0, nprobe=semantic.n_lists)
+    exact = semantic.search(query, k=10, threshold=0.0, exact=True)
+    # Compared by score: documents with identical words tie
+    np.testing.assert_allclose(approx[1], exact[1], rtol=1e-5)
+    assert approx[2] == exact[2]
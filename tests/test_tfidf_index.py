@@ -0,0 +1,59 @@
+import os
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+import tfidf_index  # noqa: E402
+from tfidf_index import TfidfIndex, sync_with_corpus  # noqa: E402
+
+TEXTS = ["data analyst sql excel", "cloud engineer aws", "web developer react", "data scientist python"]
+KEYS = ["k0", "k1", "k2", "k3"]
+
+
+def rows_equal(a, b):
+    return (a != b).nnz == 0
+
+
+def test_sync_appends_new_rows_of_the_same_corpus():
+    index = TfidfIndex.build(TEXTS[:2], KEYS[:2])
+    synced = sync_with_corpus(index, TEXTS, KEYS)
+    assert synced is index and synced.n_docs == 4
+    assert synced.corpus_digest == tfidf_index.corpus_digest(KEYS)
+    # Existing rows keep their vectors; new rows are the new postings
+    assert rows_equal(synced.counts, TfidfIndex.build(TEXTS).counts)
+
+
+def test_sync_rebuilds_when_the_corpus_was_rebuilt_with_as_many_rows():
+    index = TfidfIndex.build(TEXTS[:2], KEYS[:2])
+    texts, keys = ["nurse hospital care", "chef kitchen menu", *TEXTS[2:]], ["n0", "n1", *KEYS[2:]]
+    synced = sync_with_corpus(index, texts, keys)
+    assert synced is not index
+    assert rows_equal(synced.counts, TfidfIndex.build(texts).counts)
+
+
+def test_sync_rebuilds_a_snapshot_without_a_fingerprint():
+    index = TfidfIndex.build(TEXTS[:2])
+    index.corpus_digest = None
+    assert sync_with_corpus(index, TEXTS, KEYS) is not index
+
+
+def test_saves_allocate_distinct_versions(tmp_path, monkeypatch):
+    index_dir = str(tmp_path / "index")
+    first, second = TfidfIndex.build(TEXTS[:2], KEYS[:2]), TfidfIndex.build(TEXTS, KEYS)
+    # Both writers saw the same directory state before publishing
+    monkeypatch.setattr(tfidf_index, "next_version", lambda index_dir: 1)
+    first.save(index_dir)
+    second.save(index_dir)
+    assert (first.version, second.version) == (1, 2)
+    assert TfidfIndex.load(os.path.join(index_dir, "v000001")).n_docs == 2
+    loaded = tfidf_index.load_latest(index_dir)
+    assert (loaded.version, loaded.n_docs, loaded.corpus_digest) == (2, 4, second.corpus_digest)
+
+
+def test_next_version_follows_the_directory(tmp_path):
+    index_dir = str(tmp_path / "index")
+    assert tfidf_index.next_version(index_dir) == 1
+    for _ in range(tfidf_index.KEEP_SNAPSHOTS + 1):
+        TfidfIndex.build(TEXTS, KEYS).save(index_dir)
+    assert tfidf_index.next_version(index_dir) == tfidf_index.KEEP_SNAPSHOTS + 2
+    assert len(tfidf_index._snapshot_names(index_dir)) == tfidf_index.KEEP_SNAPSHOTS
@@ -0,0 +1,229 @@
+import os
+import json
+import shutil
+import hashlib
+import argparse
+import threading
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+INDEX_DIR = os.environ.get("ASCENDX_TFIDF_INDEX", "tfidf_index")
+N_FEATURES = 2 ** 18
+# IDF is recomputed once the corpus has grown this much since the last refresh
+IDF_REFRESH_RATIO = 0.1
+KEEP_SNAPSHOTS = 3
+
+
+# Incremental TF-IDF index. Terms are hashed into a fixed feature space, so
+# new postings are appended without refitting a vocabulary; only the IDF
+# weights are refreshed, from stored term counts, when the corpus has grown
+# by IDF_REFRESH_RATIO. Weighting matches TfidfVectorizer's defaults
+# (raw tf, smoothed idf, L2-normalized rows).
+class TfidfIndex:
+    def __init__(self, n_features=N_FEATURES):
+        self.n_features = n_features
+        self.hasher = HashingVectorizer(
+            n_features=n_features, stop_words='english', alternate_sign=False, norm=None
+        )
+        self.counts = sp.csr_matrix((0, n_features))
+        self.matrix = sp.csr_matrix((0, n_features))
+        self.doc_freq = np.zeros(n_features, dtype=np.int64)
+        self.idf = np.ones(n_features)
+        self.idf_docs = 0
+        self.version = 0
+        # Digest of the listing keys of the rows held, in order (see corpus_digest)
+        self.corpus_digest = corpus_digest([])
+
+    @property
+    def n_docs(self):
+        return self.counts.shape[0]
+
+    def _weigh(self, counts):
+        return normalize(counts @ sp.diags(self.idf), norm='l2', copy=False).tocsr()
+
+    def refresh_idf(self):
+        self.idf = np.log((1 + self.n_docs) / (1 + self.doc_freq)) + 1
+        self.idf_docs = self.n_docs
+        self.matrix = self._weigh(self.counts)
+
+    def append(self, texts):
+        counts = self.hasher.transform(texts)
+        self.counts = sp.vstack([self.counts, counts], format='csr')
+        self.doc_freq = self.doc_freq + np.bincount(counts.indices, minlength=self.n_features)
+        if self.n_docs > self.idf_docs * (1 + IDF_REFRESH_RATIO):
+            self.refresh_idf()
+        else:
+            # New rows use the current IDF; old rows are untouched
+            self.matrix = sp.vstack([self.matrix, self._weigh(counts)], format='csr')
+
+    def transform(self, texts):
+        return self._weigh(self.hasher.transform(texts))
+
+    @classmethod
+    def build(cls, texts, keys=None, n_features=N_FEATURES):
+        index = cls(n_features)
+        index.append(texts)
+        if keys is not None:
+            index.corpus_digest = corpus_digest(keys)
+        return index
+
+    # --- Versioned snapshots ---
+    def _write_meta(self, snapshot_dir):
+        with open(os.path.join(snapshot_dir, "meta.json"), "w") as f:
+            json.dump({"version": self.version, "n_features": self.n_features, "n_docs": self.n_docs,
+                       "idf_docs": self.idf_docs, "corpus_digest": self.corpus_digest}, f)
+
+    def save(self, index_dir=INDEX_DIR):
+        # The version is allocated from the directory at publish time, so two
+        # processes saving at once get distinct versions for distinct matrices
+        os.makedirs(index_dir, exist_ok=True)
+        tmp = os.path.join(index_dir, f"v.tmp{os.getpid()}-{threading.get_ident()}")
+        os.makedirs(tmp, exist_ok=True)
+        sp.save_npz(os.path.join(tmp, "counts.npz"), self.counts)
+        sp.save_npz(os.path.join(tmp, "tfidf.npz"), self.matrix)
+        np.save(os.path.join(tmp, "doc_freq.npy"), self.doc_freq)
+        np.save(os.path.join(tmp, "idf.npy"), self.idf)
+        version = next_version(index_dir)
+        while True:
+            self.version = version
+            self._write_meta(tmp)
+            final = os.path.join(index_dir, f"v{version:06d}")
+            try:
+                os.rename(tmp, final)
+                break
+            except OSError:
+                if not os.path.exists(final):
+                    shutil.rmtree(tmp, ignore_errors=True)
+                    raise
+                # Another process published this version first: take the next one
+                version = max(version, next_version(index_dir) - 1) + 1
+
+        latest_tmp = os.path.join(index_dir, f"LATEST.tmp{os.getpid()}")
+        with open(latest_tmp, "w") as f:
+            f.write(os.path.basename(final))
+        os.replace(latest_tmp, os.path.join(index_dir, "LATEST"))
+        _prune(index_dir)
+        return final
+
+    @classmethod
+    def load(cls, snapshot_dir):
+        with open(os.path.join(snapshot_dir, "meta.json")) as f:
+            meta = json.load(f)
+        index = cls(meta["n_features"])
+        index.counts = sp.load_npz(os.path.join(snapshot_dir, "counts.npz")).tocsr()
+        index.matrix = sp.load_npz(os.path.join(snapshot_dir, "tfidf.npz")).tocsr()
+        index.doc_freq = np.load(os.path.join(snapshot_dir, "doc_freq.npy"))
+        index.idf = np.load(os.path.join(snapshot_dir, "idf.npy"))
+        index.idf_docs = meta["idf_docs"]
+        index.version = meta["version"]
+        index.corpus_digest = meta.get("corpus_digest")
+        return index
+
+
+def corpus_digest(keys):
+    # Fingerprint of the corpus rows an index was built over, in row order
+    digest = hashlib.sha1()
+    for key in keys:
+        digest.update(key.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def latest_snapshot(index_dir=INDEX_DIR):
+    try:
+        with open(os.path.join(index_dir, "LATEST")) as f:
+            return os.path.join(index_dir, f.read().strip())
+    except OSError:
+        return None
+
+
+def latest_version(index_dir=INDEX_DIR):
+    path = latest_snapshot(index_dir)
+    return int(os.path.basename(path)[1:]) if path else 0
+
+
+def _snapshot_names(index_dir):
+    return sorted(
+        name for name in os.listdir(index_dir)
+        if name.startswith("v") and os.path.isdir(os.path.join(index_dir, name)) and ".tmp" not in name
+    )
+
+
+def next_version(index_dir=INDEX_DIR):
+    published = [int(name[1:]) for name in _snapshot_names(index_dir)] if os.path.isdir(index_dir) else []
+    return max(published + [latest_version(index_dir)]) + 1
+
+
+def load_latest(index_dir=INDEX_DIR):
+    path = latest_snapshot(index_dir)
+    return TfidfIndex.load(path) if path else None
+
+
+def _prune(index_dir):
+    for name in _snapshot_names(index_dir)[:-KEEP_SNAPSHOTS]:
+        shutil.rmtree(os.path.join(index_dir, name), ignore_errors=True)
+
+
+def sync_with_corpus(index, texts, keys):
+    # Appends corpus rows the index has not seen. The index must hold exactly
+    # the leading rows of the corpus (checked through their listing keys);
+    # a rebuilt, reordered or shrunk corpus means a full rebuild.
+    if (index is None or index.n_docs > len(texts)
+            or index.corpus_digest != corpus_digest(keys[:index.n_docs])):
+        return TfidfIndex.build(texts, keys)
+    if index.n_docs < len(texts):
+        index.append(texts[index.n_docs:])
+        index.corpus_digest = corpus_digest(keys)
+    return index
+
+
+# Polls the snapshot directory from a background thread, so workers pick up
+# new index versions without blocking a request on the load.
+class SnapshotWatcher:
+    def __init__(self, index_dir=INDEX_DIR, interval=60):
+        self.index_dir = index_dir
+        self.interval = interval
+        self.current = None
+        self.loaded = threading.Event()
+        self._loaded_path = None
+        self._stop = threading.Event()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _poll(self):
+        path = latest_snapshot(self.index_dir)
+        if path and path != self._loaded_path:
+            self.current = TfidfIndex.load(path)
+            self._loaded_path = path
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._poll()
+            except Exception:
+                pass  # keep serving the previous snapshot
+            self.loaded.set()
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        self._stop.set()
+
+
+if __name__ == "__main__":
+    import job_store
+
+    parser = argparse.ArgumentParser(description="Build and update versioned TF-IDF index snapshots")
+    parser.add_argument("command", choices=["build", "update", "refresh-idf"])
+    parser.add_argument("--index", default=INDEX_DIR)
+    args = parser.parse_args()
+
+    corpus = job_store.load_corpus()
+    texts, keys = corpus['combined_text'].tolist(), corpus['listing_key'].tolist()
+    if args.command == "build":
+        index = TfidfIndex.build(texts, keys)
+    else:
+        index = sync_with_corpus(load_latest(args.index), texts, keys)
+        if args.command == "refresh-idf":
+            index.refresh_idf()
+    print(f"Saved {index.n_docs} documents to {index.save(args.index)}")